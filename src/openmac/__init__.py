@@ -1,38 +1,68 @@
 from __future__ import annotations
 
-from openmac.apps.browsers.base.objects.application import IBrowser
-from openmac.apps.browsers.base.objects.tabs import (
-    IBrowserTab,
-    IBrowserTabManager,
-    IBrowserTabsManager,
-)
-from openmac.apps.browsers.base.objects.windows import IBrowserWindow, IBrowserWindowsManager
-from openmac.apps.browsers.chrome.objects.application import Chrome
-from openmac.apps.browsers.chrome.objects.bookmark_folders import (
-    ChromeBookmarkFolder,
-    ChromeBookmarkFoldersManager,
-)
-from openmac.apps.browsers.chrome.objects.tabs import ChromeTab
-from openmac.apps.browsers.chrome.objects.windows import ChromeWindow
-from openmac.apps.browsers.safari.objects.application import Safari
-from openmac.apps.browsers.safari.objects.documents import SafariDocument
-from openmac.apps.browsers.safari.objects.tabs import SafariTab
-from openmac.apps.browsers.safari.objects.windows import SafariWindow
-
-__all__: list[str] = [
-    "Chrome",
-    "ChromeBookmarkFolder",
-    "ChromeBookmarkFoldersManager",
-    "ChromeTab",
-    "ChromeWindow",
-    "IBrowser",
-    "IBrowserTab",
-    "IBrowserTabManager",
-    "IBrowserTabsManager",
-    "IBrowserWindow",
-    "IBrowserWindowsManager",
-    "Safari",
-    "SafariDocument",
-    "SafariTab",
-    "SafariWindow",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+# Explicit `X as X` re-exports let type checkers see the lazy names; a unit test
+# keeps them in line with `_LAZY_IMPORTS`.
+if TYPE_CHECKING:
+    from openmac.apps.browsers.base.objects.application import IBrowser as IBrowser
+    from openmac.apps.browsers.base.objects.tabs import (
+        IBrowserTab as IBrowserTab,
+        IBrowserTabManager as IBrowserTabManager,
+        IBrowserTabsManager as IBrowserTabsManager,
+    )
+    from openmac.apps.browsers.base.objects.windows import (
+        IBrowserWindow as IBrowserWindow,
+        IBrowserWindowsManager as IBrowserWindowsManager,
+    )
+    from openmac.apps.browsers.chrome.objects.application import Chrome as Chrome
+    from openmac.apps.browsers.chrome.objects.bookmark_folders import (
+        ChromeBookmarkFolder as ChromeBookmarkFolder,
+        ChromeBookmarkFoldersManager as ChromeBookmarkFoldersManager,
+    )
+    from openmac.apps.browsers.chrome.objects.tabs import ChromeTab as ChromeTab
+    from openmac.apps.browsers.chrome.objects.windows import ChromeWindow as ChromeWindow
+    from openmac.apps.browsers.safari.objects.application import Safari as Safari
+    from openmac.apps.browsers.safari.objects.documents import SafariDocument as SafariDocument
+    from openmac.apps.browsers.safari.objects.tabs import SafariTab as SafariTab
+    from openmac.apps.browsers.safari.objects.windows import SafariWindow as SafariWindow
+
+# Public names are imported on first access so that `import openmac` does not
+# load appscript and every browser integration up front. The table is the single
+# source of the public API, and `__getattr__` has to read it from this module,
+# hence the RUF067 exception for it.
+_LAZY_IMPORTS: Final[dict[str, str]] = {  # noqa: RUF067
+    "Chrome": "openmac.apps.browsers.chrome.objects.application",
+    "ChromeBookmarkFolder": "openmac.apps.browsers.chrome.objects.bookmark_folders",
+    "ChromeBookmarkFoldersManager": "openmac.apps.browsers.chrome.objects.bookmark_folders",
+    "ChromeTab": "openmac.apps.browsers.chrome.objects.tabs",
+    "ChromeWindow": "openmac.apps.browsers.chrome.objects.windows",
+    "IBrowser": "openmac.apps.browsers.base.objects.application",
+    "IBrowserTab": "openmac.apps.browsers.base.objects.tabs",
+    "IBrowserTabManager": "openmac.apps.browsers.base.objects.tabs",
+    "IBrowserTabsManager": "openmac.apps.browsers.base.objects.tabs",
+    "IBrowserWindow": "openmac.apps.browsers.base.objects.windows",
+    "IBrowserWindowsManager": "openmac.apps.browsers.base.objects.windows",
+    "Safari": "openmac.apps.browsers.safari.objects.application",
+    "SafariDocument": "openmac.apps.browsers.safari.objects.documents",
+    "SafariTab": "openmac.apps.browsers.safari.objects.tabs",
+    "SafariWindow": "openmac.apps.browsers.safari.objects.windows",
+}
+
+__all__: list[str] = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -10,6 +10,8 @@ class IBrowser[
     BrowserWindowsManagerT: IBrowserWindowsManager,
     BrowserTabsManagerT: IBrowserTabsManager,
 ](ABC):
+    __slots__ = ()
+
     # region Properties
 
     @property
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class IBrowserTab(ABC):
+    __slots__ = ()
+
     window: IBrowserWindow
 
     # region Properties
@@ -67,6 +69,8 @@ class IBrowserTab(ABC):
 
 
 class IBrowserTabsManager(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def active(self) -> IBrowserTabsManager: ...
@@ -91,6 +95,8 @@ class IBrowserTabsManager(ABC):
 
 
 class IBrowserTabManager(BaseManager[IBrowserTab], ABC):
+    __slots__ = ()
+
     window: IBrowserWindow
 
     @property
@@ -7,6 +7,8 @@ from openmac.apps.browsers.base.objects.tabs import IBrowserTabManager, IBrowser
 
 
 class IBrowserWindow(ABC):
+    __slots__ = ()
+
     # region Properties
 
     @property
@@ -40,6 +42,8 @@ class IBrowserWindow(ABC):
 
 
 class IBrowserWindowsManager(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tabs(self) -> IBrowserTabsManager: ...
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 
-from appscript import GenericReference, Keyword, app
+from appscript import GenericReference, app
 
 from openmac.apps.browsers.base.objects.application import IBrowser
 from openmac.apps.browsers.chrome.objects.bookmark_folders import (
@@ -11,25 +12,43 @@ from openmac.apps.browsers.chrome.objects.bookmark_folders import (
 )
 from openmac.apps.browsers.chrome.objects.tabs import ChromeWindowsTabsManager
 from openmac.apps.browsers.chrome.objects.windows import ChromeWindowsManager
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseApplication
 
 
 @dataclass(slots=True, kw_only=True)
 class Chrome(BaseApplication, IBrowser[ChromeWindowsManager, ChromeWindowsTabsManager]):
     ae_chrome: GenericReference = field(default_factory=lambda: app(id="com.google.Chrome"))
+    properties_ttl: float = 0.0
+
+    _cached_properties: tuple[float, ChromeProperties] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     # region Properties
 
     @property
     def version(self) -> str:
+        if self.properties_ttl > 0:
+            return self.properties.version
+
         return self.ae_chrome.version()
 
     @property
     def title(self) -> str:
+        if self.properties_ttl > 0:
+            return self.properties.title
+
         return self.ae_chrome.title()
 
     @property
     def frontmost(self) -> bool:
+        if self.properties_ttl > 0:
+            return self.properties.frontmost
+
         return self.ae_chrome.frontmost()
 
     @property
@@ -46,16 +65,34 @@ class Chrome(BaseApplication, IBrowser[ChromeWindowsManager, ChromeWindowsTabsMa
 
     @property
     def properties(self) -> ChromeProperties:
+        if self.properties_ttl <= 0:
+            return self._load_properties()
+
+        now = time.monotonic()
+        if (
+            self._cached_properties is None
+            or now - self._cached_properties[0] >= self.properties_ttl
+        ):
+            self._cached_properties = (now, self._load_properties())
+
+        return self._cached_properties[1]
+
+    def invalidate(self) -> None:
+        """Drop properties kept for `properties_ttl` seconds so the next read fetches them."""
+
+        self._cached_properties = None
+
+    def _load_properties(self) -> ChromeProperties:
         ae_properties = self.ae_chrome.properties()
         return ChromeProperties(
-            version=ae_properties[Keyword("version")],
-            title=ae_properties[Keyword("title")],
-            frontmost=ae_properties[Keyword("frontmost")],
+            version=ae_properties[keywords.VERSION],
+            title=ae_properties[keywords.TITLE],
+            frontmost=ae_properties[keywords.FRONTMOST],
             bookmarks_bar=ChromeBookmarkFolder(
-                ae_bookmark_folder=ae_properties[Keyword("bookmarks_bar")],
+                ae_bookmark_folder=ae_properties[keywords.BOOKMARKS_BAR],
             ),
             other_bookmarks=ChromeBookmarkFolder(
-                ae_bookmark_folder=ae_properties[Keyword("other_bookmarks")],
+                ae_bookmark_folder=ae_properties[keywords.OTHER_BOOKMARKS],
             ),
         )
 
@@ -84,6 +121,7 @@ class Chrome(BaseApplication, IBrowser[ChromeWindowsManager, ChromeWindowsTabsMa
     # region Actions
 
     def activate(self) -> None:
+        self.invalidate()
         self.ae_chrome.activate()
 
     # endregion Actions
@@ -4,11 +4,12 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from appscript import GenericReference, Keyword
+from appscript import GenericReference
 
 from openmac.apps.browsers.chrome.objects.bookmark_items import (
     ChromeBookmarkItem,
 )
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseManager, BaseObject
 
 if TYPE_CHECKING:
@@ -46,9 +47,9 @@ class ChromeBookmarkFolder(BaseObject):
     def properties(self) -> ChromeBookmarkFolderProperties:
         ae_properties = self.ae_bookmark_folder.properties()
         return ChromeBookmarkFolderProperties(
-            id=ae_properties[Keyword("id")],
-            title=ae_properties[Keyword("title")],
-            index=ae_properties[Keyword("index")],
+            id=ae_properties[keywords.ID],
+            title=ae_properties[keywords.TITLE],
+            index=ae_properties[keywords.INDEX],
         )
 
 
@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from appscript import GenericReference, Keyword
+from appscript import GenericReference
 
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseObject
 
 if TYPE_CHECKING:
@@ -42,10 +43,10 @@ class ChromeBookmarkItem(BaseObject):
     def properties(self) -> ChromeBookmarkItemProperties:
         ae_properties = self.ae_bookmark_item.properties()
         return ChromeBookmarkItemProperties(
-            id=ae_properties[Keyword("id")],
-            title=ae_properties[Keyword("title")],
-            url=ae_properties[Keyword("URL")],
-            index=ae_properties[Keyword("index")],
+            id=ae_properties[keywords.ID],
+            title=ae_properties[keywords.TITLE],
+            url=ae_properties[keywords.URL],
+            index=ae_properties[keywords.INDEX],
         )
 
 
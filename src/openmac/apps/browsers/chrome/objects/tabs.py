@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from appscript import GenericReference, Keyword, k
 
@@ -11,12 +15,33 @@ from openmac.apps.browsers.base.objects.tabs import (
     IBrowserTabManager,
     IBrowserTabsManager,
 )
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseManager, BaseObject
+from openmac.apps.shared.filterer import Filterer, Prefetched, Q, unwrap_prefetched
+from openmac.apps.shared.prefetch import PrefetchField, iter_prefetched
+from openmac.apps.shared.whose import WhoseField, narrow_by_query
 from openmac.apps.system_events.helpers import preserve_focus as preserve_focus_context_manager
 
 if TYPE_CHECKING:
     from openmac.apps.browsers.chrome.objects.windows import ChromeWindow, ChromeWindowsManager
 
+# Polling for `loading` starts at the caller's delay and backs off up to this cap.
+_POLL_BACKOFF: Final = 1.5
+_MAX_POLL_DELAY: Final = 0.5
+
+_TAB_WHOSE_FIELDS: Final[dict[str, WhoseField]] = {
+    "id": WhoseField(name="id", kind=int, as_text=True),
+    "url": WhoseField(name="URL", kind=str),
+    "title": WhoseField(name="title", kind=str),
+    "loading": WhoseField(name="loading", kind=bool),
+}
+_TAB_PREFETCH_FIELDS: Final[dict[str, PrefetchField]] = {
+    "id": PrefetchField(keyword=keywords.ID, convert=int),
+    "url": PrefetchField(keyword=keywords.URL),
+    "title": PrefetchField(keyword=keywords.TITLE),
+    "loading": PrefetchField(keyword=keywords.LOADING),
+}
+
 
 @dataclass(slots=True)
 class ChromeTab(BaseObject, IBrowserTab):
@@ -47,13 +72,7 @@ class ChromeTab(BaseObject, IBrowserTab):
 
     @property
     def properties(self) -> ChromeTabProperties:
-        ae_properties = self.ae_tab.properties()
-        return ChromeTabProperties(
-            url=ae_properties[Keyword("URL")],
-            title=ae_properties[Keyword("title")],
-            loading=ae_properties[Keyword("loading")],
-            id=ae_properties[Keyword("id")],
-        )
+        return _make_tab_properties(self.ae_tab.properties())
 
     # endregion Properties
 
@@ -75,7 +94,7 @@ class ChromeTab(BaseObject, IBrowserTab):
         ae_tab = self.window.ae_window.tabs.end.make(
             new=k.tab,
             with_properties={
-                Keyword("URL"): self.url,
+                keywords.URL: self.url,
             },
         )
 
@@ -115,10 +134,74 @@ class ChromeTab(BaseObject, IBrowserTab):
                 raise TimeoutError(f"ChromeTab did not finish loading within {timeout} seconds.")
 
             time.sleep(delay)
+            delay = _next_poll_delay(delay)
+
+    # `timeout` keeps the signature of `wait_until_loaded` and names the limit in the
+    # error, hence the ASYNC109 exception.
+    async def wait_until_loaded_async(
+        self,
+        timeout: float = 10.0,  # noqa: ASYNC109
+        delay: float = 0.1,
+    ) -> None:
+        """Wait like `wait_until_loaded` without blocking the running event loop.
+
+        Raises:
+            TimeoutError: If the tab is still loading after `timeout` seconds.
+
+        """
+
+        try:
+            async with asyncio.timeout(timeout):
+                while await asyncio.to_thread(lambda: self.loading):
+                    await asyncio.sleep(delay)
+                    delay = _next_poll_delay(delay)
+        except TimeoutError:
+            raise TimeoutError(
+                f"ChromeTab did not finish loading within {timeout} seconds.",
+            ) from None
 
     # endregion Custom Actions
 
 
+def _make_tab_properties(ae_properties: dict[Keyword, Any]) -> ChromeTabProperties:
+    return ChromeTabProperties(
+        url=ae_properties[keywords.URL],
+        title=ae_properties[keywords.TITLE],
+        loading=ae_properties[keywords.LOADING],
+        id=int(ae_properties[keywords.ID]),
+    )
+
+
+def _iter_tab_candidates(
+    window: ChromeWindow,
+    query: Q,
+) -> Iterator[ChromeTab | Prefetched[ChromeTab]]:
+    return iter_prefetched(
+        narrow_by_query(window.ae_window.tabs, query, _TAB_WHOSE_FIELDS),
+        query,
+        _TAB_PREFETCH_FIELDS,
+        make_object=partial(ChromeTab, window),
+    )
+
+
+def _find_window_tab(window: ChromeWindow, query: Q) -> ChromeTab | None:
+    """Return the first tab of `window` matching `query`, with queried values read in bulk."""
+
+    filterer = Filterer[ChromeTab](query)
+    for candidate in _iter_tab_candidates(window, query):
+        if filterer.matches_criteria(candidate):
+            return unwrap_prefetched(candidate)
+
+    return None
+
+
+def _next_poll_delay(delay: float) -> float:
+    if delay >= _MAX_POLL_DELAY:
+        return delay
+
+    return min(delay * _POLL_BACKOFF, _MAX_POLL_DELAY)
+
+
 @dataclass(slots=True)
 class ChromeTabProperties:
     id: int
@@ -127,8 +210,51 @@ class ChromeTabProperties:
     loading: bool
 
 
+class _AsyncTabOpener(ABC):
+    """Provide `open_async` for managers that open tabs with a blocking `open`."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def open(
+        self,
+        url: str,
+        *,
+        wait_until_loaded: bool = True,
+        preserve_focus: bool = True,
+    ) -> ChromeTab: ...
+
+    # `timeout` only bounds the wait for the page, like `open`; cancelling the call
+    # with `asyncio.timeout` instead would lose a tab the worker thread still opens,
+    # hence the ASYNC109 exception.
+    async def open_async(
+        self,
+        url: str,
+        *,
+        wait_until_loaded: bool = True,
+        preserve_focus: bool = True,
+        timeout: float = 10.0,  # noqa: ASYNC109
+    ) -> ChromeTab:
+        """Open a tab like `open` without blocking the running event loop.
+
+        Like `open`, waiting for the page gives up with `TimeoutError` after
+        `timeout` seconds.
+        """
+
+        tab = await asyncio.to_thread(
+            self.open,
+            url=url,
+            wait_until_loaded=False,
+            preserve_focus=preserve_focus,
+        )
+        if wait_until_loaded:
+            await tab.wait_until_loaded_async(timeout=timeout)
+
+        return tab
+
+
 @dataclass(slots=True)
-class ChromeWindowTabsManager(IBrowserTabManager, BaseManager[ChromeTab]):
+class ChromeWindowTabsManager(_AsyncTabOpener, IBrowserTabManager, BaseManager[ChromeTab]):
     window: ChromeWindow
 
     @property
@@ -138,6 +264,18 @@ class ChromeWindowTabsManager(IBrowserTabManager, BaseManager[ChromeTab]):
             ae_tab=self.window.ae_window.active_tab(),
         )
 
+    @property
+    def properties(self) -> list[ChromeTabProperties]:
+        """Properties of every matching tab, read with one event when unfiltered."""
+
+        if self._filterer.query:
+            return [cast("ChromeTab", tab).properties for tab in self]
+
+        return [
+            _make_tab_properties(ae_properties)
+            for ae_properties in self.window.ae_window.tabs.properties()
+        ]
+
     def open(
         self,
         url: str,
@@ -169,12 +307,12 @@ class ChromeWindowTabsManager(IBrowserTabManager, BaseManager[ChromeTab]):
         preserve_focus: bool = True,
     ) -> ChromeTab:
         """Return the first matching tab by URL or open a new tab if no match exists."""
-        for tab in self:
-            if tab.url == url:
-                if wait_until_loaded:
-                    tab.wait_until_loaded()
+        tab = _find_window_tab(self.window, self._filterer.query & Q(url=url))
+        if tab is not None:
+            if wait_until_loaded:
+                tab.wait_until_loaded()
 
-                return cast("ChromeTab", tab)
+            return tab
 
         return self.open(
             url=url,
@@ -186,17 +324,20 @@ class ChromeWindowTabsManager(IBrowserTabManager, BaseManager[ChromeTab]):
         return self.window.ae_window.tabs.end.make(
             new=k.tab,
             with_properties={
-                Keyword("URL"): url,
+                keywords.URL: url,
             },
         )
 
+    def _iter_candidates(self) -> Iterator[ChromeTab | Prefetched[ChromeTab]]:
+        return _iter_tab_candidates(self.window, self._filterer.query)
+
     def _iter_objects(self) -> Any:
         for ae_tab in self.window.ae_window.tabs():
             yield ChromeTab(window=self.window, ae_tab=ae_tab)
 
 
 @dataclass(slots=True)
-class ChromeWindowsTabsManager(BaseManager[ChromeTab], IBrowserTabsManager):
+class ChromeWindowsTabsManager(_AsyncTabOpener, BaseManager[ChromeTab], IBrowserTabsManager):
     windows: ChromeWindowsManager
     only_active: bool = False
 
@@ -204,6 +345,15 @@ class ChromeWindowsTabsManager(BaseManager[ChromeTab], IBrowserTabsManager):
     def active(self) -> ChromeWindowsTabsManager:
         return ChromeWindowsTabsManager(windows=self.windows, only_active=True)
 
+    @property
+    def properties(self) -> list[ChromeTabProperties]:
+        """Properties of every matching tab, read with one event per window when unfiltered."""
+
+        if self._filterer.query or self.only_active:
+            return [tab.properties for tab in self]
+
+        return [properties for window in self.windows for properties in window.tabs.properties]
+
     def open(
         self,
         url: str,
@@ -225,12 +375,12 @@ class ChromeWindowsTabsManager(BaseManager[ChromeTab], IBrowserTabsManager):
         preserve_focus: bool = True,
     ) -> ChromeTab:
         """Return the first matching tab across windows or open one in the first window."""
-        for tab in self:
-            if tab.url == url:
-                if wait_until_loaded:
-                    tab.wait_until_loaded()
+        tab = self._find_tab(url)
+        if tab is not None:
+            if wait_until_loaded:
+                tab.wait_until_loaded()
 
-                return tab
+            return tab
 
         return self.open(
             url=url,
@@ -238,14 +388,35 @@ class ChromeWindowsTabsManager(BaseManager[ChromeTab], IBrowserTabsManager):
             preserve_focus=preserve_focus,
         )
 
-    def _iter_objects(self) -> Any:
+    def _iter_candidates(self) -> Iterator[ChromeTab | Prefetched[ChromeTab]]:
+        return self._iter_tabs(self._filterer.query)
+
+    def _find_tab(self, url: str) -> ChromeTab | None:
+        if self.only_active:
+            return next((tab for tab in self if tab.url == url), None)
+
+        query = self._filterer.query & Q(url=url)
         for window in self.windows:
-            if self.only_active:
-                yield window.tabs.active
-                continue
-
-            for ae_tab in window.ae_window.tabs():
-                yield ChromeTab(
-                    window=window,
-                    ae_tab=ae_tab,
-                )
+            tab = _find_window_tab(window, query)
+            if tab is not None:
+                return tab
+
+        return None
+
+    def _iter_objects(self) -> Any:
+        return self._iter_tabs(Q())
+
+    def _iter_tabs(self, query: Q) -> Iterator[ChromeTab | Prefetched[ChromeTab]]:
+        """Load the tabs of every window, narrowed and prefetched for `query`.
+
+        Active tabs are read in bulk by the windows manager and left unnarrowed.
+        """
+
+        if self.only_active:
+            return self.windows.iter_active_tabs()
+
+        return (
+            candidate
+            for window in self.windows
+            for candidate in _iter_tab_candidates(window, query)
+        )
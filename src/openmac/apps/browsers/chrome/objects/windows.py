@@ -2,20 +2,52 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
-from appscript import GenericReference, Keyword, k
+from appscript import GenericReference, k
 
 from openmac.apps.browsers.base.objects.windows import IBrowserWindow, IBrowserWindowsManager
 from openmac.apps.browsers.chrome.objects.tabs import (
+    ChromeTab,
     ChromeWindowsTabsManager,
     ChromeWindowTabsManager,
 )
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseManager, BaseObject
+from openmac.apps.shared.prefetch import PrefetchField, iter_prefetched
+from openmac.apps.shared.whose import WhoseField, narrow_by_query
 from openmac.apps.system_events.helpers import preserve_focus as preserve_focus_context_manager
 
 if TYPE_CHECKING:
     from openmac.apps.browsers.chrome.objects.application import Chrome
+    from openmac.apps.shared.filterer import Prefetched
+
+_WINDOW_WHOSE_FIELDS: Final[dict[str, WhoseField]] = {
+    "id": WhoseField(name="id", kind=int, as_text=True),
+    "index": WhoseField(name="index", kind=int),
+    "visible": WhoseField(name="visible", kind=bool),
+    "minimized": WhoseField(name="minimized", kind=bool),
+    "zoomed": WhoseField(name="zoomed", kind=bool),
+    "mode": WhoseField(name="mode", kind=str),
+    "title": WhoseField(name="title", kind=str),
+    "given_name": WhoseField(name="given_name", kind=str),
+}
+_WINDOW_PREFETCH_FIELDS: Final[dict[str, PrefetchField]] = {
+    "id": PrefetchField(keyword=keywords.ID, convert=int),
+    "closeable": PrefetchField(keyword=keywords.CLOSEABLE),
+    "zoomed": PrefetchField(keyword=keywords.ZOOMED),
+    "active_tab_index": PrefetchField(keyword=keywords.ACTIVE_TAB_INDEX),
+    "index": PrefetchField(keyword=keywords.INDEX),
+    "visible": PrefetchField(keyword=keywords.VISIBLE),
+    "given_name": PrefetchField(keyword=keywords.GIVEN_NAME),
+    "title": PrefetchField(keyword=keywords.TITLE),
+    "minimizable": PrefetchField(keyword=keywords.MINIMIZABLE),
+    "mode": PrefetchField(keyword=keywords.MODE),
+    "resizable": PrefetchField(keyword=keywords.RESIZABLE),
+    "bounds": PrefetchField(keyword=keywords.BOUNDS),
+    "zoomable": PrefetchField(keyword=keywords.ZOOMABLE),
+    "minimized": PrefetchField(keyword=keywords.MINIMIZED),
+}
 
 
 @dataclass(slots=True, kw_only=True)
@@ -84,21 +116,21 @@ class ChromeWindow(BaseObject, IBrowserWindow):
     def properties(self) -> ChromeWindowProperties:
         ae_properties = self.ae_window.properties()
         return ChromeWindowProperties(
-            id=ae_properties[Keyword("id")],
-            closeable=ae_properties[Keyword("closeable")],
-            zoomed=ae_properties[Keyword("zoomed")],
-            active_tab_index=ae_properties[Keyword("active_tab_index")],
-            index=ae_properties[Keyword("index")],
-            visible=ae_properties[Keyword("visible")],
-            given_name=ae_properties[Keyword("given_name")],
-            title=ae_properties[Keyword("title")],
-            minimizable=ae_properties[Keyword("minimizable")],
-            mode=ae_properties[Keyword("mode")],
-            resizable=ae_properties[Keyword("resizable")],
-            bounds=ae_properties[Keyword("bounds")],
-            zoomable=ae_properties[Keyword("zoomable")],
-            minimized=ae_properties[Keyword("minimized")],
-            active_tab=ae_properties[Keyword("active_tab")],
+            id=ae_properties[keywords.ID],
+            closeable=ae_properties[keywords.CLOSEABLE],
+            zoomed=ae_properties[keywords.ZOOMED],
+            active_tab_index=ae_properties[keywords.ACTIVE_TAB_INDEX],
+            index=ae_properties[keywords.INDEX],
+            visible=ae_properties[keywords.VISIBLE],
+            given_name=ae_properties[keywords.GIVEN_NAME],
+            title=ae_properties[keywords.TITLE],
+            minimizable=ae_properties[keywords.MINIMIZABLE],
+            mode=ae_properties[keywords.MODE],
+            resizable=ae_properties[keywords.RESIZABLE],
+            bounds=ae_properties[keywords.BOUNDS],
+            zoomable=ae_properties[keywords.ZOOMABLE],
+            minimized=ae_properties[keywords.MINIMIZED],
+            active_tab=ae_properties[keywords.ACTIVE_TAB],
         )
 
     # endregion Properties
@@ -146,6 +178,28 @@ class ChromeWindowsManager(BaseManager[ChromeWindow], IBrowserWindowsManager):
     def tabs(self) -> ChromeWindowsTabsManager:
         return ChromeWindowsTabsManager(windows=self)
 
+    def iter_active_tabs(self) -> Iterator[ChromeTab]:
+        """Load the active tab of every matching window.
+
+        Without a query, the windows and their active tabs are read with two events
+        instead of one event per window.
+        """
+
+        if self._filterer.query:
+            return (window.tabs.active for window in self)
+
+        ae_windows = self.chrome.ae_chrome.windows
+        window_references = ae_windows()
+        tab_references = ae_windows.active_tab()
+        if len(tab_references) != len(window_references):
+            # The windows changed between the two events; read them one by one.
+            return (window.tabs.active for window in self)
+
+        return (
+            ChromeTab(window=ChromeWindow(ae_window=ae_window), ae_tab=ae_tab)
+            for ae_window, ae_tab in zip(window_references, tab_references, strict=True)
+        )
+
     def new(
         self,
         *,
@@ -164,10 +218,20 @@ class ChromeWindowsManager(BaseManager[ChromeWindow], IBrowserWindowsManager):
         return self.chrome.ae_chrome.make(
             new=k.window,
             with_properties={
-                Keyword("mode"): mode,
+                keywords.MODE: mode,
             },
         )
 
+    def _iter_candidates(self) -> Iterator[ChromeWindow | Prefetched[ChromeWindow]]:
+        query = self._filterer.query
+        ae_windows = narrow_by_query(self.chrome.ae_chrome.windows, query, _WINDOW_WHOSE_FIELDS)
+        return iter_prefetched(
+            ae_windows,
+            query,
+            _WINDOW_PREFETCH_FIELDS,
+            make_object=lambda ae_window: ChromeWindow(ae_window=ae_window),
+        )
+
     def _iter_objects(self) -> Iterator[ChromeWindow]:
         for ae_window in self.chrome.ae_chrome.windows():
             yield ChromeWindow(ae_window=ae_window)
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
-from appscript import GenericReference, Keyword, k
+from appscript import GenericReference, k
 
 from openmac.apps.browsers.base.objects.tabs import (
     IBrowserTab,
     IBrowserTabManager,
     IBrowserTabsManager,
 )
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseManager, BaseObject
+from openmac.apps.shared.whose import WhoseField, narrow_by_query
 from openmac.apps.system_events.helpers import preserve_focus as preserve_focus_context_manager
 
 if TYPE_CHECKING:
     from openmac.apps.browsers.safari.objects.windows import SafariWindow, SafariWindowsManager
 
+_TAB_WHOSE_FIELDS: Final[dict[str, WhoseField]] = {
+    "url": WhoseField(name="URL", kind=str),
+    "title": WhoseField(name="name", kind=str),
+    "index": WhoseField(name="index", kind=int),
+}
+
 
 @dataclass(slots=True)
 class SafariTab(BaseObject, IBrowserTab):
@@ -164,10 +173,19 @@ class SafariWindowTabsManager(IBrowserTabManager, BaseManager[SafariTab]):
         return self.window.ae_window.tabs.end.make(
             new=k.tab,
             with_properties={
-                Keyword("URL"): url,
+                keywords.URL: url,
             },
         )
 
+    def _iter_candidates(self) -> Iterator[SafariTab]:
+        ae_tabs = narrow_by_query(
+            self.window.ae_window.tabs,
+            self._filterer.query,
+            _TAB_WHOSE_FIELDS,
+        )
+        for ae_tab in ae_tabs():
+            yield SafariTab(window=self.window, ae_tab=ae_tab)
+
     def _iter_objects(self) -> Any:
         for ae_tab in self.window.ae_window.tabs():
             yield SafariTab(window=self.window, ae_tab=ae_tab)
@@ -189,7 +207,8 @@ class SafariWindowsTabsManager(BaseManager[SafariTab], IBrowserTabsManager):
         wait_until_loaded: bool = True,
         preserve_focus: bool = True,
     ) -> SafariTab:
-        if self.windows.count == 0:
+        first_window = next(iter(self.windows), None)
+        if first_window is None:
             window = self.windows.new(
                 url=url,
                 preserve_focus=preserve_focus,
@@ -200,7 +219,7 @@ class SafariWindowsTabsManager(BaseManager[SafariTab], IBrowserTabsManager):
 
             return tab
 
-        return self.windows.first.tabs.open(
+        return first_window.tabs.open(
             url=url,
             wait_until_loaded=wait_until_loaded,
             preserve_focus=preserve_focus,
@@ -227,6 +246,16 @@ class SafariWindowsTabsManager(BaseManager[SafariTab], IBrowserTabsManager):
             preserve_focus=preserve_focus,
         )
 
+    def _iter_candidates(self) -> Iterator[SafariTab]:
+        if self.only_active:
+            yield from self._iter_objects()
+            return
+
+        query = self._filterer.query
+        for window in self.windows:
+            for ae_tab in narrow_by_query(window.ae_window.tabs, query, _TAB_WHOSE_FIELDS)():
+                yield SafariTab(window=window, ae_tab=ae_tab)
+
     def _iter_objects(self) -> Any:
         for window in self.windows:
             if self.only_active:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
 from appscript import GenericReference, Keyword, k
 
@@ -12,12 +12,24 @@ from openmac.apps.browsers.safari.objects.tabs import (
     SafariWindowsTabsManager,
     SafariWindowTabsManager,
 )
+from openmac.apps.shared import keywords
 from openmac.apps.shared.base import BaseManager, BaseObject
+from openmac.apps.shared.whose import WhoseField, narrow_by_query
 from openmac.apps.system_events.helpers import preserve_focus as preserve_focus_context_manager
 
 if TYPE_CHECKING:
     from openmac.apps.browsers.safari.objects.application import Safari
 
+_WINDOW_WHOSE_FIELDS: Final[dict[str, WhoseField]] = {
+    "id": WhoseField(name="id", kind=int),
+    "index": WhoseField(name="index", kind=int),
+    "visible": WhoseField(name="visible", kind=bool),
+    "miniaturized": WhoseField(name="miniaturized", kind=bool),
+    "zoomed": WhoseField(name="zoomed", kind=bool),
+    "name": WhoseField(name="name", kind=str),
+    "title": WhoseField(name="name", kind=str),
+}
+
 
 @dataclass(slots=True, kw_only=True)
 class SafariWindow(BaseObject, IBrowserWindow):
@@ -127,11 +139,23 @@ class SafariWindowsManager(BaseManager[SafariWindow], IBrowserWindowsManager):
     def _make_ae_window(self, url: str | None) -> GenericReference:
         command_kwargs: dict[str, dict[Keyword, str]] = {}
         if url is not None:
-            command_kwargs["with_properties"] = {Keyword("URL"): url}
+            command_kwargs["with_properties"] = {keywords.URL: url}
 
         self.safari.ae_safari.make(new=k.document, **command_kwargs)
         return self.safari.ae_safari.windows.first
 
+    def _iter_candidates(self) -> Iterator[SafariWindow]:
+        ae_windows = narrow_by_query(
+            self.safari.ae_safari.windows,
+            self._filterer.query,
+            _WINDOW_WHOSE_FIELDS,
+        )
+        return self._iter_ae_windows(ae_windows)
+
     def _iter_objects(self) -> Iterator[SafariWindow]:
-        for ae_window in self.safari.ae_safari.windows():
+        return self._iter_ae_windows(self.safari.ae_safari.windows)
+
+    @staticmethod
+    def _iter_ae_windows(ae_windows: GenericReference) -> Iterator[SafariWindow]:
+        for ae_window in ae_windows():
             yield SafariWindow(ae_window=ae_window)
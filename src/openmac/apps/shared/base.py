@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Iterator
+from collections import deque
+from collections.abc import AsyncIterator, Hashable, Iterator
 from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
 from openmac.apps.exceptions import MultipleObjectsReturnedError, ObjectDoesNotExistError
-from openmac.apps.shared.filterer import Filterer, Q
+from openmac.apps.shared.filterer import Filterer, Prefetched, Q, unwrap_prefetched
 
 BaseObjectT_co = TypeVar("BaseObjectT_co", covariant=True)
 
@@ -73,23 +75,30 @@ class BaseManager(ABC, Generic[BaseObjectT_co]):  # noqa: UP046
     _filterer: Filterer[BaseObjectT_co] = field(default_factory=Filterer, init=False)
 
     def __iter__(self) -> Iterator[BaseObjectT_co]:
-        for obj in self._iter_objects():
-            if self._filterer.matches_criteria(obj):
-                yield obj
+        matches_criteria = self._filterer.matches_criteria
+        for candidate in self._iter_candidates():
+            if matches_criteria(candidate):
+                yield unwrap_prefetched(candidate)
+
+    async def __aiter__(self) -> AsyncIterator[BaseObjectT_co]:
+        for obj in await self.all_async():
+            yield obj
 
     def get(self, **filters: Any) -> BaseObjectT_co:
-        objects = self.filter(**filters).all
-        if len(objects) == 0:
-            msg = f"{type(self).__name__}.get() found 0 objects for criteria {filters!r}"
-            raise ObjectDoesNotExistError(msg)
-        if len(objects) > 1:
-            msg = (
-                f"{type(self).__name__}.get() found {len(objects)} objects "
-                f"for criteria {filters!r}, expected 1"
-            )
-            raise MultipleObjectsReturnedError(msg)
+        objects = iter(self.filter(**filters))
+        for obj in objects:
+            other_objects = sum(1 for _ in objects)
+            if other_objects:
+                msg = (
+                    f"{type(self).__name__}.get() found {other_objects + 1} objects "
+                    f"for criteria {filters!r}, expected 1"
+                )
+                raise MultipleObjectsReturnedError(msg)
 
-        return objects[0]
+            return obj
+
+        msg = f"{type(self).__name__}.get() found 0 objects for criteria {filters!r}"
+        raise ObjectDoesNotExistError(msg)
 
     def filter(self, **filters: Any) -> BaseManager[BaseObjectT_co]:
         self._filterer.update_query(Q(**filters))
@@ -101,7 +110,12 @@ class BaseManager(ABC, Generic[BaseObjectT_co]):  # noqa: UP046
 
     @property
     def all(self) -> list[BaseObjectT_co]:
-        return self._filterer.filter(list(self._iter_objects()))
+        return list(self)
+
+    async def all_async(self) -> list[BaseObjectT_co]:
+        """Load `all` in a worker thread so the running event loop is not blocked."""
+
+        return await asyncio.to_thread(lambda: self.all)
 
     @property
     def first(self) -> BaseObjectT_co:
@@ -112,16 +126,28 @@ class BaseManager(ABC, Generic[BaseObjectT_co]):  # noqa: UP046
 
     @property
     def last(self) -> BaseObjectT_co:
-        objects = self.all
+        objects = deque(self, maxlen=1)
 
         if not objects:
             raise ObjectDoesNotExistError(f"{type(self).__name__} contains no objects.")
 
-        return objects[-1]
+        return objects[0]
 
     @property
     def count(self) -> int:
-        return len(self.all)
+        return sum(1 for _ in self)
+
+    def _iter_candidates(self) -> Iterator[BaseObjectT_co | Prefetched[BaseObjectT_co]]:
+        """Load objects that may match the current query.
+
+        Managers backed by a scriptable collection can override this to narrow the
+        collection on the application side, or to wrap objects in `Prefetched` with
+        values the query reads, fetched for the whole collection at once. The
+        filterer is still applied to every candidate, so overrides only need to
+        return a superset of the matches.
+        """
+
+        return self._iter_objects()
 
     @abstractmethod
     def _iter_objects(self) -> Iterator[BaseObjectT_co]:
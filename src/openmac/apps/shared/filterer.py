@@ -1,18 +1,133 @@
 from __future__ import annotations
 
 import operator
+from collections import Counter
 from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
-from functools import reduce
-from typing import Any, ClassVar, Final, Generic, TypeVar
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import cache, reduce
+from typing import Any, ClassVar, Final, Generic, NamedTuple, TypeVar
 
 from openmac.apps.exceptions import InvalidFilterError
 
 T = TypeVar("T")
+PrefetchedT_co = TypeVar("PrefetchedT_co", covariant=True)
 FilterOperation = Callable[[Any, Any], bool]
+Predicate = Callable[[Any], bool]
+# Field path prefixes resolved while matching one item, keyed by path.
+ResolvedPaths = dict[tuple[str, ...], list[Any]]
+ItemPredicate = Callable[[Any, ResolvedPaths], bool]
 MISSING: Final = object()
 
 
+def _is_member(value: Any, container: Any) -> bool:
+    try:
+        return value in container
+    except TypeError:
+        # Prepared `__in` lookups hold frozensets, which reject unhashable values
+        # that a list would simply not contain.
+        if type(container) is frozenset:
+            return False
+        raise
+
+
+def _starts_with(value: Any, prefix: Any) -> bool:
+    return str(value).startswith(str(prefix))
+
+
+def _ends_with(value: Any, suffix: Any) -> bool:
+    return str(value).endswith(str(suffix))
+
+
+def _starts_with_text(value: Any, prefix: str) -> bool:
+    return (value if type(value) is str else str(value)).startswith(prefix)
+
+
+def _ends_with_text(value: Any, suffix: str) -> bool:
+    return (value if type(value) is str else str(value)).endswith(suffix)
+
+
+def _match_everything(_item: Any, _resolved_paths: ResolvedPaths) -> bool:
+    return True
+
+
+def _match_all(predicates: tuple[ItemPredicate, ...]) -> ItemPredicate:
+    def matches(item: Any, resolved_paths: ResolvedPaths) -> bool:
+        return all(predicate(item, resolved_paths) for predicate in predicates)
+
+    return matches
+
+
+def _match_any(predicates: tuple[ItemPredicate, ...]) -> ItemPredicate:
+    def matches(item: Any, resolved_paths: ResolvedPaths) -> bool:
+        return any(predicate(item, resolved_paths) for predicate in predicates)
+
+    return matches
+
+
+def _match_odd(predicates: tuple[ItemPredicate, ...]) -> ItemPredicate:
+    def matches(item: Any, resolved_paths: ResolvedPaths) -> bool:
+        return reduce(
+            operator.xor,
+            (predicate(item, resolved_paths) for predicate in predicates),
+        )
+
+    return matches
+
+
+def _negate(predicate: ItemPredicate) -> ItemPredicate:
+    return lambda item, resolved_paths: not predicate(item, resolved_paths)
+
+
+@dataclass(frozen=True, slots=True)
+class Prefetched(Generic[PrefetchedT_co]):  # noqa: UP046
+    """Wrap an object with attribute values that were fetched in bulk.
+
+    The filterer reads attributes from `values` first and falls back to `obj`, so
+    lookups through relations keep working. Managers unwrap matches back to `obj`,
+    which means the snapshot is only ever used to decide whether an object matches.
+    Lookups on fields named `obj` or `values` read the wrapper's own attributes, so
+    objects exposing such fields must not be wrapped.
+    """
+
+    obj: PrefetchedT_co
+    values: Mapping[str, Any]
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self.values:
+            return self.values[name]
+
+        return getattr(self.obj, name)
+
+
+def unwrap_prefetched[ObjectT](candidate: ObjectT | Prefetched[ObjectT]) -> ObjectT:
+    """Return the object of `candidate`, dropping values prefetched for it."""
+
+    return candidate.obj if isinstance(candidate, Prefetched) else candidate
+
+
+class _CompiledLookup(NamedTuple):
+    key: str
+    field_path: tuple[str, ...]
+    operation: FilterOperation
+    value: Any
+
+
+class _CompiledQuery(NamedTuple):
+    children: tuple[_CompiledQuery | _CompiledLookup, ...]
+    connector: str
+    negated: bool
+
+
 class Filterer(Generic[T]):  # noqa: UP046
+    __slots__ = (
+        "_compiled_query",
+        "_initial_query",
+        "_predicate",
+        "_query",
+        "_shared_paths",
+    )
+
     _OPERATIONS: ClassVar[dict[str, FilterOperation]] = {
         "": operator.eq,
         "eq": operator.eq,
@@ -21,16 +136,25 @@ class Filterer(Generic[T]):  # noqa: UP046
         "lte": operator.le,
         "gt": operator.gt,
         "gte": operator.ge,
-        "in": lambda a, b: a in b,
+        "in": _is_member,
         "contains": operator.contains,
-        "startswith": lambda a, b: str(a).startswith(str(b)),
-        "endswith": lambda a, b: str(a).endswith(str(b)),
+        "startswith": _starts_with,
+        "endswith": _ends_with,
+    }
+    # Whether values of a type are iterated as relations; filled in as types are seen
+    # so the `Iterable` ABC check runs once per type rather than once per value.
+    _ITERABLE_RELATION_TYPES: ClassVar[dict[type, bool]] = {list: True, tuple: True}
+    # Used instead of `_OPERATIONS` when the lookup value is already a string.
+    _TEXT_OPERATIONS: ClassVar[dict[str, FilterOperation]] = {
+        "startswith": _starts_with_text,
+        "endswith": _ends_with_text,
     }
 
     def __init__(self, query: Q | Mapping[str, Any] | None = None) -> None:
         normalized_query = self._normalize_query(query)
         self._initial_query = normalized_query
         self._query = normalized_query.copy()
+        self._compile()
 
     @property
     def query(self) -> Q:
@@ -41,68 +165,116 @@ class Filterer(Generic[T]):  # noqa: UP046
 
     def update_query(self, query: Q) -> None:
         self._query &= query
+        self._compile()
 
     def filter(self, items: list[T]) -> list[T]:
-        return [item for item in items if self.matches_criteria(item)]
+        predicate = self._predicate
+        return [item for item in items if predicate(item)]
 
     def exclude(self, items: list[T]) -> list[T]:
-        return [item for item in items if not self.matches_criteria(item)]
-
-    def matches_criteria(self, item: T) -> bool:
-        return self._matches_query(item, self._query)
-
-    def _matches_query(self, item: T, query: Q) -> bool:
-        if not query.children:
-            result = True
+        predicate = self._predicate
+        return [item for item in items if not predicate(item)]
+
+    def matches_criteria(self, item: T | Prefetched[T]) -> bool:
+        return self._predicate(item)
+
+    def _compile(self) -> None:
+        self._compiled_query = self._compile_query(self._query)
+        self._shared_paths = self._find_shared_paths(self._compiled_query)
+
+        predicate = self._build_query_predicate(self._compiled_query)
+        # Paths are only reused while one item is matched: every call gets its own
+        # memo, so objects may change between calls and concurrent calls stay apart.
+        self._predicate: Predicate = lambda item: predicate(item, {})
+
+    def _build_query_predicate(self, query: _CompiledQuery) -> ItemPredicate:
+        """Build a closure that evaluates `query` without walking the query tree per item."""
+
+        predicates = tuple(self._build_child_predicate(child) for child in query.children)
+
+        if not predicates:
+            matches: ItemPredicate = _match_everything
+        elif len(predicates) == 1:
+            matches = predicates[0]
+        elif query.connector == Q.AND:
+            matches = _match_all(predicates)
+        elif query.connector == Q.OR:
+            matches = _match_any(predicates)
         else:
-            child_results = [self._matches_child(item, child) for child in query.children]
-            if query.connector == Q.AND:
-                result = all(child_results)
-            elif query.connector == Q.OR:
-                result = any(child_results)
-            elif query.connector == Q.XOR:
-                result = reduce(operator.xor, child_results)
-            else:
-                msg = f"Unsupported Q connector: {query.connector}"
-                raise InvalidFilterError(msg)
+            matches = _match_odd(predicates)
 
-        return not result if query.negated else result
+        return _negate(matches) if query.negated else matches
 
-    def _matches_child(self, item: T, child: Q | tuple[str, Any]) -> bool:
-        if isinstance(child, Q):
-            return self._matches_query(item, child)
+    def _build_child_predicate(self, child: _CompiledQuery | _CompiledLookup) -> ItemPredicate:
+        if isinstance(child, _CompiledQuery):
+            return self._build_query_predicate(child)
 
-        key, value = child
-        return self._matches_lookup(item, key, value)
+        return self._build_lookup_predicate(child)
+
+    def _build_lookup_predicate(self, lookup: _CompiledLookup) -> ItemPredicate:
+        key, field_path, operation, value = lookup
+        resolve_field_path = self._resolve_field_path
+        get_value = operator.attrgetter(".".join(field_path))
+        # Paths shared with other lookups are resolved through the per-item memo.
+        through_relation = any(
+            field_path[:depth] in self._shared_paths for depth in range(1, len(field_path) + 1)
+        )
 
-    def _matches_lookup(self, item: T, key: str, value: Any) -> bool:
-        field_path, operator_name = self._parse_lookup(key)
-        operation = self._OPERATIONS.get(operator_name)
+        def matches(item: Any, resolved_paths: ResolvedPaths) -> bool:
+            nonlocal through_relation
+            if not through_relation:
+                try:
+                    item_value = get_value(item)
+                except AttributeError:
+                    # The path crosses a relation or a missing value; resolve this lookup
+                    # field by field from now on instead of failing the fast walk per item.
+                    through_relation = True
+                else:
+                    if not callable(item_value):
+                        return operation(item_value, value)
 
-        if operation is None:
-            raise InvalidFilterError(f"Unsupported operator: {operator_name}")
+            item_values = resolve_field_path(item, field_path, key, resolved_paths=resolved_paths)
+            return any(operation(item_value, value) for item_value in item_values)
 
-        item_values = self._resolve_field_path(item, field_path, key)
-        return any(operation(item_value, value) for item_value in item_values)
+        return matches
 
-    def _parse_lookup(self, key: str) -> tuple[list[str], str]:
+    @classmethod
+    @cache
+    def _parse_lookup(cls, key: str) -> tuple[tuple[str, ...], str]:
+        # Cached per class, so every filterer shares the parsed form of a lookup
+        # instead of splitting it again for each item it matches.
         if "__" not in key:
-            return [key], "eq"
+            return (key,), "eq"
 
         field_path, operator_name = key.rsplit("__", 1)
-        if operator_name in self._OPERATIONS:
-            return field_path.split("__"), operator_name
+        if operator_name in cls._OPERATIONS:
+            return tuple(field_path.split("__")), operator_name
 
-        return key.split("__"), "eq"
+        return tuple(key.split("__")), "eq"
 
-    def _resolve_field_path(self, item: T, field_path: list[str], lookup_key: str) -> list[Any]:
+    def _resolve_field_path(
+        self,
+        item: T,
+        field_path: tuple[str, ...],
+        lookup_key: str,
+        *,
+        resolved_paths: ResolvedPaths,
+    ) -> list[Any]:
+        shared_paths = self._shared_paths
         values: list[Any] = [item]
 
-        for field_name in field_path:
-            next_values: list[Any] = []
-            for value in values:
-                next_values.extend(self._resolve_value(value, field_name, lookup_key))
-            values = next_values
+        for depth, field_name in enumerate(field_path, start=1):
+            path = field_path[:depth]
+            if path in resolved_paths:
+                values = resolved_paths[path]
+            else:
+                next_values: list[Any] = []
+                for value in values:
+                    next_values.extend(self._resolve_value(value, field_name, lookup_key))
+                values = next_values
+
+                if path in shared_paths:
+                    resolved_paths[path] = values
 
             if not values:
                 break
@@ -139,9 +311,71 @@ class Filterer(Generic[T]):  # noqa: UP046
     def _get_attribute_value_or_missing(value: Any, field_name: str) -> Any:
         return getattr(value, field_name, MISSING)
 
-    @staticmethod
-    def _is_iterable_relation(value: Any) -> bool:
-        return isinstance(value, Iterable) and not isinstance(value, str | bytes | bytearray | dict)
+    @classmethod
+    def _is_iterable_relation(cls, value: Any) -> bool:
+        value_type = type(value)
+        is_relation = cls._ITERABLE_RELATION_TYPES.get(value_type)
+        if is_relation is None:
+            is_relation = isinstance(value, Iterable) and not isinstance(
+                value,
+                str | bytes | bytearray | dict,
+            )
+            cls._ITERABLE_RELATION_TYPES[value_type] = is_relation
+
+        return is_relation
+
+    @classmethod
+    def _compile_query(cls, query: Q) -> _CompiledQuery:
+        """Translate `query` into the structure matched against every item.
+
+        Lookup keys are parsed and `__in` values are converted to frozensets once per
+        query rather than once per item. The public query keeps the caller's values.
+        """
+
+        return _CompiledQuery(
+            children=tuple(cls._compile_child(child) for child in query.children),
+            connector=query.connector,
+            negated=query.negated,
+        )
+
+    @classmethod
+    def _compile_child(cls, child: Q | tuple[str, Any]) -> _CompiledQuery | _CompiledLookup:
+        if isinstance(child, Q):
+            return cls._compile_query(child)
+
+        key, value = child
+        field_path, operator_name = cls._parse_lookup(key)
+        if operator_name == "in" and isinstance(value, list | tuple | set):
+            with suppress(TypeError):
+                value = frozenset(value)
+
+        operation = cls._OPERATIONS[operator_name]
+        if type(value) is str:
+            operation = cls._TEXT_OPERATIONS.get(operator_name, operation)
+
+        return _CompiledLookup(
+            key=key,
+            field_path=field_path,
+            operation=operation,
+            value=value,
+        )
+
+    @classmethod
+    def _find_shared_paths(cls, query: _CompiledQuery) -> frozenset[tuple[str, ...]]:
+        path_counts = Counter(
+            lookup.field_path[:depth]
+            for lookup in cls._iter_compiled_lookups(query)
+            for depth in range(1, len(lookup.field_path) + 1)
+        )
+        return frozenset(path for path, count in path_counts.items() if count > 1)
+
+    @classmethod
+    def _iter_compiled_lookups(cls, query: _CompiledQuery) -> Iterator[_CompiledLookup]:
+        for child in query.children:
+            if isinstance(child, _CompiledQuery):
+                yield from cls._iter_compiled_lookups(child)
+            else:
+                yield child
 
     @staticmethod
     def _normalize_query(query: Q | Mapping[str, Any] | None) -> Q:
@@ -154,12 +388,15 @@ class Filterer(Generic[T]):  # noqa: UP046
 
 
 class Q:
+    __slots__ = ("children", "connector", "negated")
+
     AND: ClassVar[str] = "AND"
     OR: ClassVar[str] = "OR"
     XOR: ClassVar[str] = "XOR"
     default: ClassVar[str] = AND
     conditional: ClassVar[bool] = True
     _VALID_CONNECTORS: ClassVar[frozenset[str]] = frozenset({AND, OR, XOR})
+    _SCALAR_TYPES: ClassVar[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
 
     def __init__(
         self,
@@ -333,6 +570,9 @@ class Q:
 
     @classmethod
     def _make_hashable(cls, value: Any) -> Hashable:
+        # Lookup values are almost always scalars; skip the ABC checks for them.
+        if type(value) in cls._SCALAR_TYPES:
+            return value
         if isinstance(value, Mapping):
             return tuple(sorted((key, cls._make_hashable(item)) for key, item in value.items()))
         if isinstance(value, list | tuple):
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Final
+
+from appscript import Keyword
+
+# Property and parameter keywords shared by the scripting dictionaries, built once
+# instead of on every property read.
+
+ACTIVE_TAB: Final = Keyword("active_tab")
+ACTIVE_TAB_INDEX: Final = Keyword("active_tab_index")
+BOOKMARKS_BAR: Final = Keyword("bookmarks_bar")
+BOUNDS: Final = Keyword("bounds")
+CLOSEABLE: Final = Keyword("closeable")
+FRONTMOST: Final = Keyword("frontmost")
+GIVEN_NAME: Final = Keyword("given_name")
+ID: Final = Keyword("id")
+INDEX: Final = Keyword("index")
+LOADING: Final = Keyword("loading")
+MINIMIZABLE: Final = Keyword("minimizable")
+MINIMIZED: Final = Keyword("minimized")
+MODE: Final = Keyword("mode")
+OTHER_BOOKMARKS: Final = Keyword("other_bookmarks")
+RESIZABLE: Final = Keyword("resizable")
+TITLE: Final = Keyword("title")
+URL: Final = Keyword("URL")
+VERSION: Final = Keyword("version")
+VISIBLE: Final = Keyword("visible")
+ZOOMABLE: Final = Keyword("zoomable")
+ZOOMED: Final = Keyword("zoomed")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from appscript import GenericReference, Keyword
+
+from openmac.apps.shared.filterer import Prefetched, Q
+
+
+@dataclass(frozen=True, slots=True)
+class PrefetchField:
+    """Describe how to read an object attribute from a `properties()` record.
+
+    `convert` must match what the object's own accessor does with the raw value,
+    so filtering on a prefetched value behaves like filtering on the live one.
+    """
+
+    keyword: Keyword
+    convert: Callable[[Any], Any] | None = None
+
+
+def iter_prefetched[ObjectT](
+    ae_elements: GenericReference,
+    query: Q,
+    fields: Mapping[str, PrefetchField],
+    *,
+    make_object: Callable[[GenericReference], ObjectT],
+) -> Iterator[ObjectT | Prefetched[ObjectT]]:
+    """Load an object for every element, with the values `query` reads prefetched.
+
+    When the query references any of `fields`, their values are read for all elements
+    at once: a single field is read as one property column, several fields through
+    one `properties()` event. Either way the filterer does not send one event per
+    object and field.
+    """
+
+    ae_objects = ae_elements()
+    field_names = query.referenced_base_fields & fields.keys()
+    if not field_names or not ae_objects:
+        return (make_object(ae_object) for ae_object in ae_objects)
+
+    columns = _read_columns(ae_elements, {name: fields[name] for name in field_names})
+    if any(len(column) != len(ae_objects) for column in columns.values()):
+        # The collection changed between the events; read values one by one.
+        return (make_object(ae_object) for ae_object in ae_objects)
+
+    return (
+        Prefetched(
+            obj=make_object(ae_object),
+            values={name: column[index] for name, column in columns.items()},
+        )
+        for index, ae_object in enumerate(ae_objects)
+    )
+
+
+def _read_columns(
+    ae_elements: GenericReference,
+    fields: Mapping[str, PrefetchField],
+) -> dict[str, list[Any]]:
+    if len(fields) == 1:
+        ((name, prefetch_field),) = fields.items()
+        ae_values = getattr(ae_elements, prefetch_field.keyword.AS_name)()
+        return {name: [_convert(prefetch_field, value) for value in ae_values]}
+
+    ae_properties = ae_elements.properties()
+    return {
+        name: [
+            _convert(prefetch_field, properties[prefetch_field.keyword])
+            for properties in ae_properties
+        ]
+        for name, prefetch_field in fields.items()
+    }
+
+
+def _convert(prefetch_field: PrefetchField, value: Any) -> Any:
+    if prefetch_field.convert is None:
+        return value
+
+    return prefetch_field.convert(value)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from appscript import GenericReference, its
+
+from openmac.apps.shared.filterer import Q
+
+WhoseOperation = Callable[[GenericReference, Any], GenericReference]
+
+_TEXT_OPERATIONS: Final[dict[str, WhoseOperation]] = {
+    "": operator.eq,
+    "eq": operator.eq,
+    "contains": lambda reference, value: reference.contains(value),
+    "startswith": lambda reference, value: reference.beginswith(value),
+    "endswith": lambda reference, value: reference.endswith(value),
+}
+_NUMBER_OPERATIONS: Final[dict[str, WhoseOperation]] = {
+    "": operator.eq,
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+_BOOLEAN_OPERATIONS: Final[dict[str, WhoseOperation]] = {
+    "": operator.eq,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+# Applications never find an empty string inside text, while Python always does.
+_SUBSTRING_OPERATORS: Final = frozenset({"contains", "startswith", "endswith"})
+# Ordering text does not order the numbers it spells, so text-backed fields only
+# push down lookups that keep exact matches.
+_EQUALITY_OPERATIONS: Final[dict[str, WhoseOperation]] = {
+    "": operator.eq,
+    "eq": operator.eq,
+}
+_OPERATIONS_BY_KIND: Final[dict[type, dict[str, WhoseOperation]]] = {
+    str: _TEXT_OPERATIONS,
+    int: _NUMBER_OPERATIONS,
+    bool: _BOOLEAN_OPERATIONS,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WhoseField:
+    """Describe a scriptable property that can be tested inside a whose clause.
+
+    `kind` is the exact Python type of the property value. Lookups are only pushed
+    down when their value has the same type, so the application never has to
+    coerce operands.
+
+    `as_text` marks properties the application stores as text while the object
+    exposes them as `kind`, such as Chrome ids. Only equality and membership are
+    pushed down for them, with operands converted to text.
+    """
+
+    name: str
+    kind: type[str | int | bool]
+    as_text: bool = False
+
+
+def narrow_by_query(
+    ae_elements: GenericReference,
+    query: Q,
+    fields: Mapping[str, WhoseField],
+) -> GenericReference:
+    """Return `ae_elements` narrowed by the part of `query` the application can evaluate."""
+
+    test = build_whose_test(query, fields)
+    if test is None:
+        return ae_elements
+
+    return ae_elements[test]
+
+
+def build_whose_test(query: Q, fields: Mapping[str, WhoseField]) -> GenericReference | None:
+    """Translate `query` into an `its`-based test that selects a superset of its matches.
+
+    Application-side string comparisons ignore case, so only lookups that can widen
+    the selection are pushed down. Lookups that cannot be expressed are dropped
+    from AND nodes and disable the push-down for OR nodes; the caller is expected
+    to apply the full query to the returned elements afterwards.
+    """
+
+    if query.negated or query.connector == Q.XOR:
+        return None
+
+    tests: list[GenericReference] = []
+    for child in query.children:
+        if isinstance(child, Q):
+            test = build_whose_test(child, fields)
+        else:
+            lookup, value = child
+            test = _build_lookup_test(lookup, value, fields)
+
+        if test is None:
+            if query.connector == Q.AND:
+                continue
+            return None
+
+        tests.append(test)
+
+    if not tests:
+        return None
+
+    first_test, *other_tests = tests
+    if not other_tests:
+        return first_test
+    if query.connector == Q.AND:
+        return first_test.AND(*other_tests)
+
+    return first_test.OR(*other_tests)
+
+
+def _build_lookup_test(
+    lookup: str,
+    value: Any,
+    fields: Mapping[str, WhoseField],
+) -> GenericReference | None:
+    field_name, _, operator_name = lookup.partition("__")
+    whose_field = fields.get(field_name)
+    if whose_field is None:
+        return None
+
+    reference = getattr(its, whose_field.name)
+    if operator_name == "in":
+        if not isinstance(value, list | tuple | set | frozenset):
+            return None
+        if not all(type(item) is whose_field.kind for item in value):
+            return None
+
+        return reference.isin([_to_operand(whose_field, item) for item in value])
+
+    operations = (
+        _EQUALITY_OPERATIONS if whose_field.as_text else _OPERATIONS_BY_KIND[whose_field.kind]
+    )
+    operation = operations.get(operator_name)
+    if (
+        operation is None
+        or type(value) is not whose_field.kind
+        or (operator_name in _SUBSTRING_OPERATORS and not value)
+    ):
+        return None
+
+    return operation(reference, _to_operand(whose_field, value))
+
+
+def _to_operand(whose_field: WhoseField, value: Any) -> Any:
+    return str(value) if whose_field.as_text else value
@@ -15,3 +15,16 @@ def test_application_properties_complete(chrome: Chrome) -> None:
     diff = properties_keys.symmetric_difference(ae_properties_keys)
 
     assert diff == {"class_"}
+
+
+def test_application_properties_are_kept_for_properties_ttl() -> None:
+    chrome = Chrome(properties_ttl=60.0)
+
+    properties = chrome.properties
+
+    assert chrome.properties is properties
+    assert chrome.version == properties.version
+
+    chrome.invalidate()
+
+    assert chrome.properties is not properties
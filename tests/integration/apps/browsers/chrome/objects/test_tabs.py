@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from contextlib import suppress
+from typing import cast
 
 import pytest
 from appscript import CommandError
@@ -58,3 +60,23 @@ def test_tab_close(new_tab_no_wait: ChromeTab) -> None:
 
     with pytest.raises(CommandError):
         _ = new_tab_no_wait.url
+
+
+def test_tabs_manager_properties_match_each_tab(chrome: Chrome) -> None:
+    tabs = chrome.windows.first.tabs
+
+    assert tabs.properties == [cast("ChromeTab", tab).properties for tab in tabs]
+    assert [properties.id for properties in chrome.tabs.properties] == [
+        tab.id for tab in chrome.tabs
+    ]
+
+
+def test_tabs_open_async_returns_loaded_tab(chrome: Chrome) -> None:
+    tab = asyncio.run(chrome.windows.first.tabs.open_async(url="https://www.google.com"))
+
+    try:
+        assert not tab.loading
+        assert tab.url.startswith("https://www.google.")
+    finally:
+        with suppress(CommandError):
+            tab.close()
@@ -23,3 +23,16 @@ def test_window_properties_complete(window: ChromeWindow) -> None:
     diff = properties_keys.symmetric_difference(ae_properties_keys)
 
     assert diff == {"class_"}
+
+
+def test_windows_filter_by_id_returns_matching_window(chrome: Chrome, window: ChromeWindow) -> None:
+    windows = chrome.windows.filter(id=window.id).all
+
+    assert [matched.id for matched in windows] == [window.id]
+
+
+def test_windows_active_tabs_match_each_window(chrome: Chrome, window: ChromeWindow) -> None:
+    active_tabs = list(chrome.windows.iter_active_tabs())
+
+    assert [tab.id for tab in active_tabs] == [matched.tabs.active.id for matched in chrome.windows]
+    assert [tab.window.id for tab in active_tabs] == [matched.id for matched in chrome.windows]
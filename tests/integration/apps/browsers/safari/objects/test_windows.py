@@ -20,3 +20,9 @@ def window(safari: Safari) -> Generator[SafariWindow]:
     finally:
         with suppress(CommandError):
             window.close()
+
+
+def test_windows_filter_by_id_returns_matching_window(safari: Safari, window: SafariWindow) -> None:
+    windows = safari.windows.filter(id=window.id).all
+
+    assert [matched.id for matched in windows] == [window.id]
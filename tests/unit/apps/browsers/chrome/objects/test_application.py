@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from openmac.apps.browsers.chrome.objects.application import Chrome
+from openmac.apps.shared import keywords
+
+if TYPE_CHECKING:
+    from appscript import GenericReference
+
+
+@dataclass(slots=True)
+class FakeAEChrome:
+    version_value: str = "1.0"
+    properties_calls: int = field(default=0, init=False)
+    activations: int = field(default=0, init=False)
+
+    def properties(self) -> dict[Any, Any]:
+        self.properties_calls += 1
+        return {
+            keywords.VERSION: self.version_value,
+            keywords.TITLE: "Google Chrome",
+            keywords.FRONTMOST: True,
+            keywords.BOOKMARKS_BAR: "bookmarks-bar",
+            keywords.OTHER_BOOKMARKS: "other-bookmarks",
+        }
+
+    def version(self) -> str:
+        return self.version_value
+
+    def title(self) -> str:
+        return "Google Chrome"
+
+    def frontmost(self) -> bool:
+        return False
+
+    def activate(self) -> None:
+        self.activations += 1
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [100.0]
+    monkeypatch.setattr(
+        "openmac.apps.browsers.chrome.objects.application.time.monotonic",
+        lambda: now[0],
+    )
+    return now
+
+
+def make_chrome(ae_chrome: FakeAEChrome, properties_ttl: float = 0.0) -> Chrome:
+    return Chrome(ae_chrome=cast("GenericReference", ae_chrome), properties_ttl=properties_ttl)
+
+
+def test_properties_are_read_on_every_access_without_ttl() -> None:
+    ae_chrome = FakeAEChrome()
+    chrome = make_chrome(ae_chrome)
+
+    properties = chrome.properties
+    _ = chrome.properties
+
+    assert ae_chrome.properties_calls == 2
+    assert properties.version == "1.0"
+    assert properties.bookmarks_bar.ae_bookmark_folder == "bookmarks-bar"
+    assert properties.other_bookmarks.ae_bookmark_folder == "other-bookmarks"
+    assert chrome.version == "1.0"
+    assert chrome.title == "Google Chrome"
+    assert chrome.frontmost is False
+    assert ae_chrome.properties_calls == 2
+
+
+def test_properties_are_reused_within_ttl(clock: list[float]) -> None:
+    ae_chrome = FakeAEChrome()
+    chrome = make_chrome(ae_chrome, properties_ttl=0.5)
+
+    assert (chrome.version, chrome.title, chrome.frontmost) == ("1.0", "Google Chrome", True)
+    assert ae_chrome.properties_calls == 1
+
+    ae_chrome.version_value = "2.0"
+    clock[0] += 0.4
+
+    assert chrome.version == "1.0"
+
+    clock[0] += 0.1
+
+    assert chrome.version == "2.0"
+    assert ae_chrome.properties_calls == 2
+
+
+def test_invalidate_and_activate_drop_cached_properties() -> None:
+    ae_chrome = FakeAEChrome()
+    chrome = make_chrome(ae_chrome, properties_ttl=60)
+
+    _ = chrome.properties
+    chrome.invalidate()
+    _ = chrome.properties
+    chrome.activate()
+    _ = chrome.properties
+
+    assert ae_chrome.properties_calls == 3
+    assert ae_chrome.activations == 1
+
+
+def test_cached_properties_do_not_affect_equality() -> None:
+    ae_chrome = FakeAEChrome()
+    chrome = make_chrome(ae_chrome, properties_ttl=60)
+    other = make_chrome(ae_chrome, properties_ttl=60)
+
+    _ = chrome.properties
+
+    assert chrome == other
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from openmac.apps.browsers.chrome.objects.tabs import (
+    ChromeTab,
+    ChromeTabProperties,
+    ChromeWindowsTabsManager,
+    ChromeWindowTabsManager,
+)
+from openmac.apps.shared import keywords
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from appscript import GenericReference, Keyword
+
+    from openmac.apps.browsers.chrome.objects.windows import ChromeWindow, ChromeWindowsManager
+
+
+@dataclass(slots=True)
+class FakeAETab:
+    loading_checks: list[bool]
+    calls: int = field(default=0, init=False)
+
+    def loading(self) -> bool:
+        self.calls += 1
+        return self.loading_checks.pop(0)
+
+
+def make_tab(loading_checks: list[bool]) -> ChromeTab:
+    return ChromeTab(
+        window=cast("ChromeWindow", None),
+        ae_tab=cast("GenericReference", FakeAETab(loading_checks)),
+    )
+
+
+def test_wait_until_loaded_backs_off_between_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("openmac.apps.browsers.chrome.objects.tabs.time.sleep", delays.append)
+    tab = make_tab([True, True, True, True, True, True, False])
+
+    tab.wait_until_loaded(delay=0.1)
+
+    assert delays == pytest.approx([0.1, 0.15, 0.225, 0.3375, 0.5, 0.5])
+
+
+def test_wait_until_loaded_keeps_delays_above_the_backoff_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr("openmac.apps.browsers.chrome.objects.tabs.time.sleep", delays.append)
+    tab = make_tab([True, True, False])
+
+    tab.wait_until_loaded(delay=1.0)
+
+    assert delays == [1.0, 1.0]
+
+
+def test_wait_until_loaded_async_polls_until_loaded() -> None:
+    tab = make_tab([True, True, False])
+
+    asyncio.run(tab.wait_until_loaded_async(delay=0.001))
+
+    assert cast("FakeAETab", tab.ae_tab).calls == 3
+
+
+def test_wait_until_loaded_async_gives_up_after_timeout() -> None:
+    tab = make_tab([True] * 1000)
+
+    with pytest.raises(TimeoutError, match=r"did not finish loading within 0\.01 seconds"):
+        asyncio.run(tab.wait_until_loaded_async(timeout=0.01, delay=0.001))
+
+
+@dataclass(slots=True)
+class FakeAETabsEnd:
+    loading_checks: list[bool]
+    made_tabs: list[FakeAETab] = field(default_factory=list, init=False)
+
+    def make(self, **_kwargs: object) -> FakeAETab:
+        ae_tab = FakeAETab(list(self.loading_checks))
+        self.made_tabs.append(ae_tab)
+        return ae_tab
+
+
+@dataclass(frozen=True, slots=True)
+class FakeAETabRef:
+    tabs: FakeAETabs = field(compare=False, repr=False)
+    index: int
+
+    def URL(self) -> str:  # noqa: N802
+        return self.tabs.urls[self.index]
+
+    def properties(self) -> dict[Keyword, object]:
+        return self.tabs.record(self.index)
+
+
+@dataclass(slots=True)
+class FakeAETabs:
+    urls: list[str]
+    end: FakeAETabsEnd = field(default_factory=lambda: FakeAETabsEnd([False]))
+    column_reads: int = field(default=0, init=False)
+    properties_calls: int = field(default=0, init=False)
+    whose_tests: list[object] = field(default_factory=list, init=False)
+
+    def __getitem__(self, test: object) -> FakeAETabs:
+        self.whose_tests.append(test)
+        return self
+
+    def __call__(self) -> list[FakeAETabRef]:
+        return [FakeAETabRef(self, index) for index in range(len(self.urls))]
+
+    def URL(self) -> list[str]:  # noqa: N802
+        self.column_reads += 1
+        return self.urls
+
+    def id(self) -> list[str]:
+        return [str(index + 7) for index in range(len(self.urls))]
+
+    def properties(self) -> list[dict[Keyword, object]]:
+        self.properties_calls += 1
+        return [self.record(index) for index in range(len(self.urls))]
+
+    def record(self, index: int) -> dict[Keyword, object]:
+        return {
+            keywords.ID: str(index + 7),
+            keywords.URL: self.urls[index],
+            keywords.TITLE: f"Tab {index}",
+            keywords.LOADING: False,
+        }
+
+
+@dataclass(slots=True)
+class FakeAEWindow:
+    tabs: FakeAETabs
+
+
+@dataclass(slots=True)
+class FakeWindow:
+    ae_window: FakeAEWindow
+
+    @property
+    def tabs(self) -> ChromeWindowTabsManager:
+        return ChromeWindowTabsManager(window=cast("ChromeWindow", self))
+
+
+@dataclass(slots=True)
+class FakeWindows:
+    windows: list[FakeWindow]
+
+    def __iter__(self) -> Iterator[FakeWindow]:
+        return iter(self.windows)
+
+    @property
+    def first(self) -> FakeWindow:
+        return self.windows[0]
+
+    def iter_active_tabs(self) -> Iterator[ChromeTab]:
+        for window in self.windows:
+            yield ChromeTab(window=cast("ChromeWindow", window), ae_tab=window.ae_window.tabs()[0])
+
+
+def make_window_manager(*urls: str) -> ChromeWindowTabsManager:
+    return FakeWindow(FakeAEWindow(FakeAETabs(list(urls)))).tabs
+
+
+def make_windows_manager(*windows_urls: list[str]) -> ChromeWindowsTabsManager:
+    windows = [FakeWindow(FakeAEWindow(FakeAETabs(urls))) for urls in windows_urls]
+    return ChromeWindowsTabsManager(windows=cast("ChromeWindowsManager", FakeWindows(windows)))
+
+
+def fake_ae_tabs(manager: ChromeWindowTabsManager) -> FakeAETabs:
+    return cast("FakeAETabs", manager.window.ae_window.tabs)
+
+
+def test_window_tab_manager_reads_properties_with_one_event() -> None:
+    manager = make_window_manager("https://one.example", "https://two.example")
+
+    properties = manager.properties
+
+    assert properties == [
+        ChromeTabProperties(id=7, url="https://one.example", title="Tab 0", loading=False),
+        ChromeTabProperties(id=8, url="https://two.example", title="Tab 1", loading=False),
+    ]
+    assert fake_ae_tabs(manager).properties_calls == 1
+
+
+def test_window_tab_manager_reads_properties_of_matching_tabs_only() -> None:
+    manager = make_window_manager("https://one.example", "https://two.example")
+    manager.filter(url="https://two.example")
+
+    properties = manager.properties
+
+    assert [tab_properties.id for tab_properties in properties] == [8]
+    assert fake_ae_tabs(manager).properties_calls == 0
+
+
+def test_windows_tabs_manager_reads_properties_with_one_event_per_window() -> None:
+    manager = make_windows_manager(["https://one.example"], ["https://two.example"])
+    ae_tabs = [cast("FakeWindow", window).ae_window.tabs for window in manager.windows]
+
+    properties = manager.properties
+
+    assert [tab_properties.url for tab_properties in properties] == [
+        "https://one.example",
+        "https://two.example",
+    ]
+    assert [tabs.properties_calls for tabs in ae_tabs] == [1, 1]
+
+
+def test_windows_tabs_manager_reads_properties_of_matching_tabs_only() -> None:
+    manager = make_windows_manager(["https://one.example"], ["https://two.example"])
+    ae_tabs = [cast("FakeWindow", window).ae_window.tabs for window in manager.windows]
+    manager.filter(url__contains="two")
+
+    properties = manager.properties
+
+    assert [tab_properties.url for tab_properties in properties] == ["https://two.example"]
+    assert [tabs.properties_calls for tabs in ae_tabs] == [0, 0]
+
+
+def test_active_tabs_manager_filters_active_tabs_without_a_whose_clause() -> None:
+    manager = make_windows_manager(["https://one.example"], ["https://two.example"]).active
+    ae_tabs = [cast("FakeWindow", window).ae_window.tabs for window in manager.windows]
+
+    tabs = manager.filter(url__contains="two").all
+
+    assert [tab.url for tab in tabs] == ["https://two.example"]
+    assert [tabs.whose_tests for tabs in ae_tabs] == [[], []]
+
+
+def test_tab_manager_prefetches_every_queried_field_with_one_event() -> None:
+    manager = make_window_manager("https://one.example", "https://two.example")
+    ae_tabs = fake_ae_tabs(manager)
+
+    tabs = manager.filter(url__contains="example", title="Tab 1").all
+
+    assert [cast("ChromeTab", tab).ae_tab.index for tab in tabs] == [1]
+    assert ae_tabs.properties_calls == 1
+    assert ae_tabs.column_reads == 0
+
+
+def test_get_or_open_reads_tab_urls_as_one_column() -> None:
+    ae_tabs = FakeAETabs(["https://one.example", "https://two.example"])
+    window = cast("ChromeWindow", FakeWindow(FakeAEWindow(ae_tabs)))
+    manager = ChromeWindowTabsManager(window=window)
+
+    tab = manager.get_or_open("https://two.example", wait_until_loaded=False)
+
+    assert tab.ae_tab.index == 1
+    assert ae_tabs.column_reads == 1
+    assert [repr(test) for test in ae_tabs.whose_tests] == ["its.URL == 'https://two.example'"]
+
+
+def make_opening_window(loading_checks: list[bool], *urls: str) -> FakeWindow:
+    ae_tabs = FakeAETabs(list(urls), end=FakeAETabsEnd(loading_checks))
+    return FakeWindow(FakeAEWindow(ae_tabs))
+
+
+def made_tabs(window: FakeWindow) -> list[FakeAETab]:
+    return window.ae_window.tabs.end.made_tabs
+
+
+def test_tab_manager_compares_ids_as_text_in_whose_clauses() -> None:
+    ae_tabs = FakeAETabs(["https://one.example"])
+    window = cast("ChromeWindow", FakeWindow(FakeAEWindow(ae_tabs)))
+
+    tabs = ChromeWindowTabsManager(window=window).filter(id=7).all
+
+    assert [cast("ChromeTab", tab).ae_tab.index for tab in tabs] == [0]
+    assert [repr(test) for test in ae_tabs.whose_tests] == ["its.id == '7'"]
+
+
+def test_window_tab_manager_get_or_open_looks_up_within_the_filter() -> None:
+    window = make_opening_window([False], "https://same.example", "https://same.example")
+    manager = window.tabs
+    manager.filter(title="Tab 1")
+
+    tab = manager.get_or_open("https://same.example", wait_until_loaded=False)
+
+    assert tab.ae_tab.index == 1
+    assert window.ae_window.tabs.properties_calls == 1
+    assert made_tabs(window) == []
+
+
+def test_window_tab_manager_get_or_open_opens_a_missing_tab() -> None:
+    window = make_opening_window([False], "https://one.example")
+
+    tab = window.tabs.get_or_open("https://two.example", preserve_focus=False)
+
+    assert tab.ae_tab is made_tabs(window)[0]
+
+
+def test_windows_tabs_manager_get_or_open_finds_a_tab_in_a_later_window() -> None:
+    windows = [
+        make_opening_window([False], "https://one.example"),
+        make_opening_window([False], "https://two.example"),
+    ]
+    manager = ChromeWindowsTabsManager(windows=cast("ChromeWindowsManager", FakeWindows(windows)))
+
+    tab = manager.get_or_open("https://two.example", wait_until_loaded=False)
+
+    assert tab.window is cast("ChromeWindow", windows[1])
+    assert tab.ae_tab.index == 0
+    assert [window.ae_window.tabs.column_reads for window in windows] == [1, 1]
+    assert [made_tabs(window) for window in windows] == [[], []]
+
+
+def test_windows_tabs_manager_get_or_open_opens_a_missing_tab_in_the_first_window() -> None:
+    windows = [
+        make_opening_window([False], "https://one.example"),
+        make_opening_window([False], "https://two.example"),
+    ]
+    manager = ChromeWindowsTabsManager(windows=cast("ChromeWindowsManager", FakeWindows(windows)))
+
+    tab = manager.get_or_open("https://three.example", preserve_focus=False)
+
+    assert tab.ae_tab is made_tabs(windows[0])[0]
+    assert made_tabs(windows[1]) == []
+
+
+def test_window_tab_manager_open_async_waits_until_loaded() -> None:
+    window = make_opening_window([True, False])
+
+    tab = asyncio.run(window.tabs.open_async("https://example.com", preserve_focus=False))
+
+    assert tab.ae_tab is made_tabs(window)[0]
+    assert made_tabs(window)[0].calls == 2
+
+
+def test_window_tab_manager_open_async_gives_up_waiting_after_timeout() -> None:
+    window = make_opening_window([True] * 1000)
+
+    with pytest.raises(TimeoutError, match=r"within 0\.01 seconds"):
+        asyncio.run(
+            window.tabs.open_async("https://example.com", preserve_focus=False, timeout=0.01),
+        )
+
+    assert len(made_tabs(window)) == 1
+
+
+def test_windows_tabs_manager_open_async_opens_in_the_first_window() -> None:
+    windows = [make_opening_window([False]), make_opening_window([False])]
+    manager = ChromeWindowsTabsManager(windows=cast("ChromeWindowsManager", FakeWindows(windows)))
+
+    tab = asyncio.run(manager.open_async("https://example.com", preserve_focus=False))
+
+    assert tab.ae_tab is made_tabs(windows[0])[0]
+    assert made_tabs(windows[1]) == []
+
+
+def test_windows_tabs_manager_open_async_gives_up_waiting_after_timeout() -> None:
+    windows = [make_opening_window([True] * 1000)]
+    manager = ChromeWindowsTabsManager(windows=cast("ChromeWindowsManager", FakeWindows(windows)))
+
+    with pytest.raises(TimeoutError, match=r"within 0\.01 seconds"):
+        asyncio.run(manager.open_async("https://example.com", preserve_focus=False, timeout=0.01))
+
+    assert len(made_tabs(windows[0])) == 1
+
+
+def test_tabs_and_tab_managers_do_not_carry_an_instance_dict() -> None:
+    window = cast("ChromeWindow", FakeWindow(FakeAEWindow(FakeAETabs([]))))
+
+    assert not hasattr(make_tab([]), "__dict__")
+    assert not hasattr(ChromeWindowTabsManager(window=window), "__dict__")
+    assert not hasattr(make_windows_manager(), "__dict__")
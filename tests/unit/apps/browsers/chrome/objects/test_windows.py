@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from openmac.apps.browsers.chrome.objects.windows import ChromeWindowsManager
+from openmac.apps.shared import keywords
+
+if TYPE_CHECKING:
+    from openmac.apps.browsers.chrome.objects.application import Chrome
+
+
+@dataclass(slots=True)
+class FakeAEWindow:
+    name: str
+    active_tab_reads: int = field(default=0, init=False)
+
+    def active_tab(self) -> str:
+        self.active_tab_reads += 1
+        return f"active-tab-of-{self.name}"
+
+
+@dataclass(slots=True)
+class FakeAEWindows:
+    windows: list[FakeAEWindow]
+    active_tabs: list[str] = field(default_factory=list)
+    records: list[dict[Any, Any]] = field(default_factory=list)
+    active_tab_column_reads: int = field(default=0, init=False)
+    properties_calls: int = field(default=0, init=False)
+    whose_tests: list[object] = field(default_factory=list, init=False)
+
+    def __getitem__(self, test: object) -> FakeAEWindows:
+        self.whose_tests.append(test)
+        return self
+
+    def __call__(self) -> list[FakeAEWindow]:
+        return self.windows
+
+    def properties(self) -> list[dict[Any, Any]]:
+        self.properties_calls += 1
+        return self.records
+
+    def active_tab(self) -> list[str]:
+        self.active_tab_column_reads += 1
+        return self.active_tabs
+
+
+@dataclass(slots=True)
+class FakeAEChrome:
+    windows: FakeAEWindows
+
+
+@dataclass(slots=True)
+class FakeChrome:
+    ae_chrome: FakeAEChrome
+
+
+def make_manager(ae_windows: FakeAEWindows) -> ChromeWindowsManager:
+    return ChromeWindowsManager(chrome=cast("Chrome", FakeChrome(FakeAEChrome(ae_windows))))
+
+
+def test_iter_active_tabs_reads_active_tabs_as_one_column() -> None:
+    ae_windows = FakeAEWindows(
+        windows=[FakeAEWindow("w1"), FakeAEWindow("w2")],
+        active_tabs=["tab-1", "tab-2"],
+    )
+
+    tabs = list(make_manager(ae_windows).iter_active_tabs())
+
+    assert [tab.ae_tab for tab in tabs] == ["tab-1", "tab-2"]
+    assert [tab.window.ae_window for tab in tabs] == ae_windows.windows
+    assert ae_windows.active_tab_column_reads == 1
+    assert [window.active_tab_reads for window in ae_windows.windows] == [0, 0]
+
+
+def test_iter_active_tabs_reads_windows_one_by_one_when_they_change() -> None:
+    ae_windows = FakeAEWindows(
+        windows=[FakeAEWindow("w1"), FakeAEWindow("w2")],
+        active_tabs=["tab-1"],
+    )
+
+    tabs = list(make_manager(ae_windows).iter_active_tabs())
+
+    assert [tab.ae_tab for tab in tabs] == ["active-tab-of-w1", "active-tab-of-w2"]
+    assert [window.active_tab_reads for window in ae_windows.windows] == [1, 1]
+
+
+def test_iter_active_tabs_reads_matching_windows_one_by_one() -> None:
+    ae_windows = FakeAEWindows(
+        windows=[FakeAEWindow("w1"), FakeAEWindow("w2")],
+        active_tabs=["tab-1", "tab-2"],
+        records=[
+            {keywords.VISIBLE: False, keywords.TITLE: "Mail"},
+            {keywords.VISIBLE: True, keywords.TITLE: "Docs"},
+        ],
+    )
+    manager = make_manager(ae_windows)
+    manager.filter(visible=True, title="Docs")
+
+    tabs = list(manager.iter_active_tabs())
+
+    assert [tab.ae_tab for tab in tabs] == ["active-tab-of-w2"]
+    assert ae_windows.active_tab_column_reads == 0
+    assert [window.active_tab_reads for window in ae_windows.windows] == [0, 1]
+
+
+def test_windows_manager_filters_on_prefetched_properties() -> None:
+    ae_windows = FakeAEWindows(
+        windows=[FakeAEWindow("w1"), FakeAEWindow("w2"), FakeAEWindow("w3")],
+        records=[
+            {keywords.VISIBLE: True, keywords.TITLE: "Docs - Python"},
+            {keywords.VISIBLE: False, keywords.TITLE: "Docs - PyPI"},
+            {keywords.VISIBLE: True, keywords.TITLE: "docs - lowercase"},
+        ],
+    )
+
+    windows = make_manager(ae_windows).filter(visible=True, title__contains="Docs").all
+
+    assert [window.ae_window for window in windows] == [
+        ae_windows.windows[0],
+    ]
+    assert ae_windows.properties_calls == 1
+    assert [repr(test) for test in ae_windows.whose_tests] == [
+        "(its.title.contains('Docs')).AND(its.visible == True)",
+    ]
+
+
+def test_windows_manager_iterates_windows_without_prefetching() -> None:
+    ae_windows = FakeAEWindows(windows=[FakeAEWindow("w1"), FakeAEWindow("w2")])
+    manager = make_manager(ae_windows)
+
+    assert [window.ae_window for window in manager._iter_objects()] == ae_windows.windows
+    assert [window.ae_window for window in manager] == ae_windows.windows
+    assert ae_windows.properties_calls == 0
+    assert ae_windows.whose_tests == []
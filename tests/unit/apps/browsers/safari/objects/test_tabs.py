@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+from openmac.apps.browsers.safari.objects.tabs import (
+    SafariTab,
+    SafariWindowsTabsManager,
+    SafariWindowTabsManager,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from openmac.apps.browsers.safari.objects.windows import SafariWindow, SafariWindowsManager
+
+
+@dataclass(slots=True)
+class FakeAETab:
+    url: str
+    title: str = ""
+
+    def URL(self) -> str:  # noqa: N802
+        return self.url
+
+    def name(self) -> str:
+        return self.title
+
+
+@dataclass(slots=True)
+class FakeAETabs:
+    tabs: list[FakeAETab]
+    whose_tests: list[object] = field(default_factory=list, init=False)
+
+    def __getitem__(self, test: object) -> FakeAETabs:
+        self.whose_tests.append(test)
+        return self
+
+    def __call__(self) -> list[FakeAETab]:
+        return self.tabs
+
+
+@dataclass(slots=True)
+class FakeAEWindow:
+    tabs: FakeAETabs
+
+
+@dataclass(slots=True)
+class FakeWindow:
+    ae_window: FakeAEWindow
+
+
+@dataclass(slots=True)
+class FakeWindows:
+    windows: list[FakeWindow]
+
+    def __iter__(self) -> Iterator[FakeWindow]:
+        return iter(self.windows)
+
+
+def make_window(*urls: str) -> FakeWindow:
+    return FakeWindow(FakeAEWindow(FakeAETabs([FakeAETab(url) for url in urls])))
+
+
+def whose_tests(window: FakeWindow) -> list[str]:
+    return [repr(test) for test in window.ae_window.tabs.whose_tests]
+
+
+def test_window_tabs_manager_pushes_url_lookups_down() -> None:
+    window = make_window("https://one.example", "https://two.example")
+    manager = SafariWindowTabsManager(window=cast("SafariWindow", window))
+
+    tabs = manager.filter(url__startswith="https://two").all
+
+    assert [cast("SafariTab", tab).ae_tab for tab in tabs] == [window.ae_window.tabs.tabs[1]]
+    assert whose_tests(window) == ["its.URL.beginswith('https://two')"]
+
+
+def test_window_tabs_manager_pushes_title_lookups_down_to_the_name_property() -> None:
+    window = FakeWindow(
+        FakeAEWindow(FakeAETabs([FakeAETab("a", title="Docs"), FakeAETab("b", title="Mail")])),
+    )
+    manager = SafariWindowTabsManager(window=cast("SafariWindow", window))
+
+    tabs = manager.filter(title__contains="Doc").all
+
+    assert [cast("SafariTab", tab).ae_tab for tab in tabs] == [window.ae_window.tabs.tabs[0]]
+    assert whose_tests(window) == ["its.name.contains('Doc')"]
+
+
+def test_windows_tabs_manager_pushes_the_query_down_for_every_window() -> None:
+    windows = [make_window("https://one.example"), make_window("https://two.example")]
+    manager = SafariWindowsTabsManager(windows=cast("SafariWindowsManager", FakeWindows(windows)))
+
+    tabs = manager.filter(url="https://two.example").all
+
+    assert [tab.ae_tab for tab in tabs] == [windows[1].ae_window.tabs.tabs[0]]
+    assert [tab.window.ae_window for tab in tabs] == [windows[1].ae_window]
+    assert [whose_tests(window) for window in windows] == [
+        ["its.URL == 'https://two.example'"],
+        ["its.URL == 'https://two.example'"],
+    ]
+
+
+def test_windows_tabs_manager_iterates_all_tabs_without_a_query() -> None:
+    windows = [make_window("https://one.example", "https://two.example")]
+    manager = SafariWindowsTabsManager(windows=cast("SafariWindowsManager", FakeWindows(windows)))
+
+    tabs = manager.all
+
+    assert [tab.url for tab in tabs] == ["https://one.example", "https://two.example"]
+    assert whose_tests(windows[0]) == []
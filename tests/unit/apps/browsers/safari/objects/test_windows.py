@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+from openmac.apps.browsers.safari.objects.windows import SafariWindowsManager
+
+if TYPE_CHECKING:
+    from openmac.apps.browsers.safari.objects.application import Safari
+
+
+@dataclass(slots=True)
+class FakeAEWindow:
+    window_id: int
+    window_name: str
+
+    def id(self) -> int:
+        return self.window_id
+
+    def name(self) -> str:
+        return self.window_name
+
+    def closeable(self) -> bool:
+        return self.window_id != 1
+
+
+@dataclass(slots=True)
+class FakeAEWindows:
+    windows: list[FakeAEWindow]
+    whose_tests: list[object] = field(default_factory=list, init=False)
+
+    def __getitem__(self, test: object) -> FakeAEWindows:
+        self.whose_tests.append(test)
+        return self
+
+    def __call__(self) -> list[FakeAEWindow]:
+        return self.windows
+
+
+@dataclass(slots=True)
+class FakeAESafari:
+    windows: FakeAEWindows
+
+
+@dataclass(slots=True)
+class FakeSafari:
+    ae_safari: FakeAESafari
+
+
+def make_manager(ae_windows: FakeAEWindows) -> SafariWindowsManager:
+    return SafariWindowsManager(safari=cast("Safari", FakeSafari(FakeAESafari(ae_windows))))
+
+
+def test_windows_manager_pushes_id_lookups_down_as_numbers() -> None:
+    ae_windows = FakeAEWindows(windows=[FakeAEWindow(1, "Docs"), FakeAEWindow(2, "Mail")])
+
+    windows = make_manager(ae_windows).filter(id=2).all
+
+    assert [window.ae_window for window in windows] == [ae_windows.windows[1]]
+    assert [repr(test) for test in ae_windows.whose_tests] == ["its.id == 2"]
+
+
+def test_windows_manager_pushes_title_lookups_down_to_the_name_property() -> None:
+    ae_windows = FakeAEWindows(windows=[FakeAEWindow(1, "Docs"), FakeAEWindow(2, "docs")])
+
+    windows = make_manager(ae_windows).filter(title="Docs").all
+
+    assert [window.ae_window for window in windows] == [ae_windows.windows[0]]
+    assert [repr(test) for test in ae_windows.whose_tests] == ["its.name == 'Docs'"]
+
+
+def test_windows_manager_leaves_unknown_fields_to_python() -> None:
+    ae_windows = FakeAEWindows(windows=[FakeAEWindow(1, "Mail"), FakeAEWindow(2, "Mail")])
+
+    windows = make_manager(ae_windows).filter(name__endswith="ail", closeable=True).all
+
+    assert [window.ae_window for window in windows] == [ae_windows.windows[1]]
+    assert [repr(test) for test in ae_windows.whose_tests] == ["its.name.endswith('ail')"]
+
+
+def test_windows_manager_iterates_all_windows_without_a_query() -> None:
+    ae_windows = FakeAEWindows(windows=[FakeAEWindow(1, "Docs"), FakeAEWindow(2, "Mail")])
+
+    windows = make_manager(ae_windows).all
+
+    assert [window.ae_window for window in windows] == ae_windows.windows
+    assert ae_windows.whose_tests == []
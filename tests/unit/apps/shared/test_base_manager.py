@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterator
 from dataclasses import dataclass
 
@@ -7,6 +8,7 @@ import pytest
 
 from openmac.apps.exceptions import MultipleObjectsReturnedError, ObjectDoesNotExistError
 from openmac.apps.shared.base import BaseManager
+from openmac.apps.shared.filterer import Prefetched
 
 
 @dataclass(slots=True)
@@ -113,3 +115,35 @@ def test_manager_last_raises_for_empty_result(items: list[Item]) -> None:
 
     with pytest.raises(ObjectDoesNotExistError, match=r"ItemManager contains no objects\."):
         _ = manager.last
+
+
+def test_manager_loads_objects_on_every_query(items: list[Item]) -> None:
+    manager = ItemManager(items=items)
+
+    assert manager.count == 3
+    items.pop()
+
+    assert manager.count == 2
+
+
+@dataclass(slots=True, kw_only=True)
+class PrefetchingItemManager(ItemManager):
+    def _iter_candidates(self) -> Iterator[Item | Prefetched[Item]]:
+        for item in self.items:
+            yield Prefetched(obj=item, values={"title": item.title.upper()})
+
+
+def test_manager_filters_prefetched_values_and_returns_objects(items: list[Item]) -> None:
+    manager = PrefetchingItemManager(items=items)
+
+    assert manager.filter(title="TWO").all == [items[1]]
+    assert manager.first is items[1]
+
+
+def test_manager_loads_objects_asynchronously(items: list[Item]) -> None:
+    manager = ItemManager(items=items).filter(category="odd")
+
+    async def collect() -> tuple[list[Item], list[Item]]:
+        return await manager.all_async(), [item async for item in manager]
+
+    assert asyncio.run(collect()) == ([items[0], items[2]], [items[0], items[2]])
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import pytest
 
 from openmac.apps.exceptions import InvalidFilterError
-from openmac.apps.shared.filterer import Filterer, Q
+from openmac.apps.shared.filterer import Filterer, Prefetched, Q, unwrap_prefetched
 
 
 @dataclass(slots=True)
@@ -225,3 +227,170 @@ def test_filterer_supports_xor_queries() -> None:
     filterer = Filterer[Window](Q(id="w1") ^ Q(tabs__title="Three"))
 
     assert [window.id for window in filterer.filter(windows)] == ["w1", "w3"]
+
+
+def test_filterer_keeps_caller_in_values_in_public_query() -> None:
+    filterer = Filterer[Window](Q(id__in=["w1", "w2"]))
+
+    assert filterer.query == Q(id__in=["w1", "w2"])
+
+
+def test_filter_in_lookup_accepts_unhashable_candidates() -> None:
+    windows = [
+        Window(id="w1", tabs=[]),
+        Window(id="w2", tabs=[Tab(id="t1", title="One")]),
+    ]
+
+    assert Filterer[Window](Q(tabs__in=[[]])).filter(windows) == [windows[0]]
+    assert Filterer[Window](Q(tabs__in=("t1",))).filter(windows) == []
+
+
+def test_filterers_share_parsed_lookups() -> None:
+    first = Filterer[Window]()
+    second = Filterer[Window]()
+
+    assert first._parse_lookup("tabs__title__startswith") == (("tabs", "title"), "startswith")
+    assert first._parse_lookup("tabs__title") is second._parse_lookup("tabs__title")
+
+
+def test_filter_applies_queries_narrowed_after_construction() -> None:
+    windows = [
+        Window(id="w1", tabs=[Tab(id="t1", title="One")]),
+        Window(id="w2", tabs=[Tab(id="t2", title="Two")]),
+        Window(id="w3", tabs=[Tab(id="t3", title="One")]),
+    ]
+    filterer = Filterer[Window](Q(tabs__title="One"))
+
+    filterer.update_filters(id__in=["w2", "w3"])
+
+    assert [window.id for window in filterer.filter(windows)] == ["w3"]
+
+
+def test_filter_supports_negated_nested_groups() -> None:
+    windows = [
+        Window(id="w1", tabs=[Tab(id="t1", title="One")]),
+        Window(id="w2", tabs=[Tab(id="t2", title="Two")]),
+        Window(id="w3", tabs=[Tab(id="t3", title="Three")]),
+    ]
+    filterer = Filterer[Window](Q(tabs__id__startswith="t") & ~(Q(id="w1") | Q(tabs__title="Two")))
+
+    assert [window.id for window in filterer.filter(windows)] == ["w3"]
+    assert Filterer[Window]().filter(windows) == windows
+
+
+def test_filter_resolves_nested_attributes_after_missing_parent() -> None:
+    tabs = [
+        ManagerTab(id="t1", title="One", url="https://one.example"),
+        ManagerTab(id="t2", title="Two", url="https://two.example"),
+    ]
+    items = [
+        WindowWithTabsManager(id="w1", tabs=None),  # type: ignore[arg-type]
+        WindowWithTabsManager(id="w2", tabs=TabsManager(tabs)),
+    ]
+    filterer = Filterer[WindowWithTabsManager](Q(tabs__active__title="One"))
+
+    assert filterer.filter(items) == [items[1]]
+
+
+@dataclass(slots=True)
+class CountingWindow:
+    id: str
+    _tabs: list[Tab]
+    tabs_reads: int = 0
+
+    @property
+    def tabs(self) -> list[Tab]:
+        self.tabs_reads += 1
+        return self._tabs
+
+
+def test_filter_resolves_shared_path_prefixes_once_per_item() -> None:
+    windows = [
+        CountingWindow(id="w1", _tabs=[Tab(id="t1", title="One")]),
+        CountingWindow(id="w2", _tabs=[Tab(id="t2", title="Two")]),
+    ]
+    filterer = Filterer[CountingWindow](Q(tabs__id__startswith="t", tabs__title="Two"))
+
+    assert filterer.filter(windows) == [windows[1]]
+    assert filterer.filter(windows) == [windows[1]]
+    assert [window.tabs_reads for window in windows] == [2, 2]
+
+
+@dataclass(slots=True)
+class LockstepTab:
+    """Make concurrent matches read each field at the same time."""
+
+    barrier: threading.Barrier
+    _url: str
+    _title: str
+
+    @property
+    def url(self) -> str:
+        self.barrier.wait()
+        return self._url
+
+    @property
+    def title(self) -> str:
+        self.barrier.wait()
+        return self._title
+
+
+@dataclass(slots=True)
+class LockstepWindow:
+    id: str
+    tabs: list[LockstepTab]
+
+
+def test_concurrent_matches_do_not_share_resolved_paths() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    windows = [
+        LockstepWindow(id="w1", tabs=[LockstepTab(barrier, _url="a", _title="One")]),
+        LockstepWindow(id="w2", tabs=[LockstepTab(barrier, _url="b", _title="One")]),
+    ]
+    filterer = Filterer[LockstepWindow](Q(tabs__url="a", tabs__title="One"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(filterer.matches_criteria, windows))
+
+    assert results == [True, False]
+
+
+def test_filter_text_lookups_coerce_non_string_values() -> None:
+    windows = [Window(id="w1", tabs=[]), Window(id="w2", tabs=[])]
+
+    assert Filterer[Window](Q(id__startswith="w", id__endswith="2")).filter(windows) == [
+        windows[1],
+    ]
+    assert Filterer[Window](Q(tabs__startswith="[")).filter(windows) == windows
+    assert Filterer[Window](Q(id__endswith=2)).filter(windows) == [windows[1]]
+    numbered = [Window(id="12", tabs=[]), Window(id="21", tabs=[])]
+    assert Filterer[Window](Q(id__startswith=1)).filter(numbered) == [numbered[0]]
+
+
+def test_filterer_remembers_which_types_are_iterable_relations() -> None:
+    assert Filterer._is_iterable_relation(TabsManager([]))
+    assert not Filterer._is_iterable_relation("tabs")
+    assert Filterer._ITERABLE_RELATION_TYPES[TabsManager] is True
+    assert Filterer._ITERABLE_RELATION_TYPES[str] is False
+
+
+def test_filterer_instances_do_not_carry_an_instance_dict() -> None:
+    filterer = Filterer[Window](Q(id="w1"))
+
+    assert not hasattr(filterer, "__dict__")
+
+
+def test_filter_in_lookup_propagates_errors_from_other_containers() -> None:
+    items = [CountingWindow(id="w1", _tabs=[])]
+
+    with pytest.raises(TypeError):
+        Filterer[CountingWindow](Q(tabs_reads__in="abc")).filter(items)
+
+
+def test_unwrap_prefetched_returns_the_wrapped_object() -> None:
+    tab = Tab(id="t1", title="Docs")
+    prefetched: Tab | Prefetched[Tab] = Prefetched(obj=tab, values={"title": "docs"})
+    plain: Tab | Prefetched[Tab] = tab
+
+    assert unwrap_prefetched(prefetched) is tab
+    assert unwrap_prefetched(plain) is tab
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from appscript import GenericReference, Keyword
+
+from openmac.apps.shared.filterer import Filterer, Prefetched, Q
+from openmac.apps.shared.prefetch import PrefetchField, iter_prefetched
+
+FIELDS = {
+    "id": PrefetchField(keyword=Keyword("id"), convert=int),
+    "url": PrefetchField(keyword=Keyword("URL")),
+}
+
+
+@dataclass(slots=True)
+class FakeElements:
+    references: list[str]
+    records: list[dict[Keyword, Any]]
+    properties_calls: int = field(default=0, init=False)
+    column_reads: list[str] = field(default_factory=list, init=False)
+
+    def __call__(self) -> list[str]:
+        return self.references
+
+    def __getattr__(self, name: str) -> Callable[[], list[Any]]:
+        def read_column() -> list[Any]:
+            self.column_reads.append(name)
+            return [record[Keyword(name)] for record in self.records]
+
+        return read_column
+
+    def properties(self) -> list[dict[Keyword, Any]]:
+        self.properties_calls += 1
+        return self.records
+
+
+@dataclass(slots=True)
+class Tab:
+    reference: str
+
+    @property
+    def url(self) -> str:
+        raise AssertionError("prefetched values must be used for filtering")
+
+
+def make_elements() -> FakeElements:
+    return FakeElements(
+        references=["tab-1", "tab-2"],
+        records=[
+            {Keyword("id"): "1", Keyword("URL"): "https://one.example"},
+            {Keyword("id"): "2", Keyword("URL"): "https://two.example"},
+        ],
+    )
+
+
+def test_iter_prefetched_reads_queried_fields_with_one_event() -> None:
+    elements = make_elements()
+
+    candidates = list(
+        iter_prefetched(
+            cast("GenericReference", elements),
+            Q(id=2) | Q(url__contains="one"),
+            FIELDS,
+            make_object=Tab,
+        ),
+    )
+
+    assert elements.properties_calls == 1
+    assert elements.column_reads == []
+    assert candidates == [
+        Prefetched(obj=Tab("tab-1"), values={"id": 1, "url": "https://one.example"}),
+        Prefetched(obj=Tab("tab-2"), values={"id": 2, "url": "https://two.example"}),
+    ]
+    assert Filterer[Tab](Q(url__contains="two")).filter(candidates) == [candidates[1]]  # type: ignore[arg-type]
+
+
+def test_iter_prefetched_reads_a_single_field_as_one_column() -> None:
+    elements = make_elements()
+
+    candidates = list(
+        iter_prefetched(cast("GenericReference", elements), Q(id__gt=1), FIELDS, make_object=Tab),
+    )
+
+    assert elements.properties_calls == 0
+    assert elements.column_reads == ["id"]
+    assert candidates == [
+        Prefetched(obj=Tab("tab-1"), values={"id": 1}),
+        Prefetched(obj=Tab("tab-2"), values={"id": 2}),
+    ]
+
+
+def test_iter_prefetched_skips_the_event_when_query_reads_no_known_fields() -> None:
+    elements = make_elements()
+
+    candidates = list(
+        iter_prefetched(
+            cast("GenericReference", elements),
+            Q(reference="tab-1"),
+            FIELDS,
+            make_object=Tab,
+        ),
+    )
+
+    assert elements.properties_calls == 0
+    assert elements.column_reads == []
+    assert candidates == [Tab("tab-1"), Tab("tab-2")]
+
+
+def test_iter_prefetched_skips_the_event_for_an_empty_collection() -> None:
+    elements = FakeElements(references=[], records=[])
+
+    candidates = list(
+        iter_prefetched(cast("GenericReference", elements), Q(id=1), FIELDS, make_object=Tab),
+    )
+
+    assert candidates == []
+    assert elements.properties_calls == 0
+    assert elements.column_reads == []
+
+
+def test_iter_prefetched_falls_back_when_collection_changed() -> None:
+    elements = make_elements()
+    elements.records.pop()
+
+    candidates = list(
+        iter_prefetched(cast("GenericReference", elements), Q(id=1), FIELDS, make_object=Tab),
+    )
+
+    assert candidates == [Tab("tab-1"), Tab("tab-2")]
+
+
+def test_prefetched_reads_other_attributes_from_the_object() -> None:
+    prefetched = Prefetched(obj=Tab("tab-1"), values={"id": 1})
+
+    assert prefetched.id == 1
+    assert prefetched.reference == "tab-1"
@@ -159,3 +159,9 @@ def test_q_hash_raises_for_unhashable_leaf_values() -> None:
 
     with pytest.raises(TypeError, match="Unhashable Q value"):
         hash(Q(value=UnhashableValue()))
+
+
+def test_q_instances_do_not_carry_an_instance_dict() -> None:
+    query = Q(id=1)
+
+    assert not hasattr(query, "__dict__")
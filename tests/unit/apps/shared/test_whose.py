@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from openmac.apps.shared.filterer import Q
+from openmac.apps.shared.whose import WhoseField, build_whose_test
+
+FIELDS = {
+    "id": WhoseField(name="id", kind=int),
+    "url": WhoseField(name="URL", kind=str),
+    "loading": WhoseField(name="loading", kind=bool),
+}
+TEXT_ID_FIELDS = {
+    "id": WhoseField(name="id", kind=int, as_text=True),
+}
+
+
+def test_build_whose_test_translates_exact_lookup() -> None:
+    test = build_whose_test(Q(id=7), FIELDS)
+
+    assert repr(test) == "its.id == 7"
+
+
+def test_build_whose_test_uses_application_property_names() -> None:
+    test = build_whose_test(Q(url__startswith="https://"), FIELDS)
+
+    assert repr(test) == "its.URL.beginswith('https://')"
+
+
+def test_build_whose_test_translates_in_lookup_to_isin() -> None:
+    test = build_whose_test(Q(id__in=(1, 2)), FIELDS)
+
+    assert repr(test) == "its.id.isin([1, 2])"
+
+
+def test_build_whose_test_joins_and_children() -> None:
+    test = build_whose_test(Q(id__gt=1, loading=False), FIELDS)
+
+    assert repr(test) == "(its.id > 1).AND(its.loading == False)"
+
+
+def test_build_whose_test_drops_unsupported_and_children() -> None:
+    test = build_whose_test(Q(id=1, url__ne="https://example.com", tabs__id=3), FIELDS)
+
+    assert repr(test) == "its.id == 1"
+
+
+def test_build_whose_test_joins_or_children() -> None:
+    test = build_whose_test(Q(id=1) | Q(url__contains="example"), FIELDS)
+
+    assert repr(test) == "(its.id == 1).OR(its.URL.contains('example'))"
+
+
+def test_build_whose_test_skips_or_with_unsupported_child() -> None:
+    assert build_whose_test(Q(id=1) | Q(title="One"), FIELDS) is None
+
+
+def test_build_whose_test_skips_negated_and_xor_queries() -> None:
+    assert build_whose_test(~Q(id=1), FIELDS) is None
+    assert build_whose_test(Q(id=1) ^ Q(id=2), FIELDS) is None
+
+
+def test_build_whose_test_skips_values_of_other_types() -> None:
+    assert build_whose_test(Q(id="1"), FIELDS) is None
+    assert build_whose_test(Q(id=True), FIELDS) is None
+    assert build_whose_test(Q(id__in=[1, "2"]), FIELDS) is None
+    assert build_whose_test(Q(id__in="12"), FIELDS) is None
+
+
+def test_build_whose_test_returns_none_for_empty_query() -> None:
+    assert build_whose_test(Q(), FIELDS) is None
+
+
+def test_build_whose_test_compares_text_backed_fields_as_text() -> None:
+    assert repr(build_whose_test(Q(id=7), TEXT_ID_FIELDS)) == "its.id == '7'"
+    assert repr(build_whose_test(Q(id__in=[9, 10]), TEXT_ID_FIELDS)) == "its.id.isin(['9', '10'])"
+
+
+def test_build_whose_test_skips_ordering_on_text_backed_fields() -> None:
+    assert build_whose_test(Q(id__gt=9), TEXT_ID_FIELDS) is None
+    assert build_whose_test(Q(id__lte=9), TEXT_ID_FIELDS) is None
+
+
+def test_build_whose_test_skips_substring_lookups_with_empty_text() -> None:
+    assert build_whose_test(Q(url__contains=""), FIELDS) is None
+    assert build_whose_test(Q(url__startswith=""), FIELDS) is None
+    assert build_whose_test(Q(url__endswith=""), FIELDS) is None
+    assert repr(build_whose_test(Q(url=""), FIELDS)) == "its.URL == ''"
+
+
+def test_build_whose_test_translates_nested_queries() -> None:
+    test = build_whose_test(Q(loading=False) & (Q(id=1) | Q(id=2)), FIELDS)
+
+    assert repr(test) == "(its.loading == False).AND((its.id == 1).OR(its.id == 2))"
+
+
+def test_build_whose_test_drops_nested_queries_it_cannot_express() -> None:
+    test = build_whose_test(Q(loading=False) & ~Q(id=1), FIELDS)
+
+    assert repr(test) == "its.loading == False"
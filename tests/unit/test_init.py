@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import ast
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+
+import openmac
+
+
+def test_import_openmac_does_not_load_browser_integrations() -> None:
+    code = (
+        "import sys, openmac; "
+        "loaded = sorted(m for m in ('appscript', 'openmac.apps.browsers') if m in sys.modules); "
+        "print(','.join(loaded))"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert not result.stdout.strip()
+
+
+def test_type_checking_imports_match_lazy_imports() -> None:
+    tree = ast.parse(Path(openmac.__file__).read_text(encoding="utf-8"))
+    type_checking_block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    imported = {
+        alias.name: node.module
+        for node in type_checking_block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+    assert imported == openmac._LAZY_IMPORTS
+    assert openmac.__all__ == list(openmac._LAZY_IMPORTS)
+
+
+def test_public_names_resolve_on_first_access() -> None:
+    from openmac.apps.browsers.chrome.objects.application import Chrome
+
+    assert openmac.Chrome is Chrome
+    assert "Chrome" in vars(openmac)
+
+
+def test_dir_lists_public_names() -> None:
+    assert set(openmac.__all__) <= set(dir(openmac))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Firefox'"):
+        _ = openmac.Firefox